@@ -6,14 +6,30 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
+from email import base64mime
+from email.header import Header
 import json
 import os
+import copy
+import pickle # sidecar cache of the parsed config
 import re # For email validation
 import datetime
 import time # For progress bar updates and basic scheduling
 import uuid # For unique campaign IDs
+import threading
+import queue
+import itertools
+import collections
+import contextlib
+import concurrent.futures
+
+try:
+    import orjson # optional: faster config (de)serialization
+except ImportError:
+    orjson = None
 
 CONFIG_FILE = "bulk_emailer_config_profiles.json"
+CONFIG_CACHE_FILE = CONFIG_FILE + ".pkl" # parsed-config cache keyed by the JSON file's mtime
 SCHEDULED_CAMPAIGNS_FILE = "scheduled_campaigns.json" # For persistent scheduled jobs
 
 DEFAULT_PLACEHOLDERS = {
@@ -33,6 +49,133 @@ AUTO_DETECT_PATTERNS = {
 
 DEFAULT_PROFILE_NAME = "Default Profile"
 
+# Inverted alias table: normalized header -> canonical mapping key. Built once so
+# auto-detection is a single dict lookup per header instead of nested loops.
+_HEADER_LOOKUP = {alias.lower().replace(" ", "").replace("_", ""): key
+                  for key, aliases in AUTO_DETECT_PATTERNS.items() for alias in aliases}
+
+# Compiled once; _is_valid_email runs per CSV row on bulk sends
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+# One compiled pattern matching every known placeholder, so templates are
+# rendered in a single pass instead of one str.replace per placeholder.
+_PLACEHOLDER_RE = re.compile(r"\{\{(" + "|".join(DEFAULT_PLACEHOLDERS) + r")\}\}")
+
+def _render_template(template, values):
+    """Substitute all {{PLACEHOLDER}} tokens in one pass. `values` maps placeholder key -> text."""
+    if "{{" not in template: return template # fast path: nothing to substitute
+    return _PLACEHOLDER_RE.sub(lambda m: str(values.get(m.group(1), "")), template)
+
+def _compile_template(text):
+    """One-shot parse of a template into (literals, keys); rendering is then just a
+    join of literals interleaved with row values, no regex work per row."""
+    parts = _PLACEHOLDER_RE.split(text)
+    return parts[0::2], parts[1::2]
+
+def _render_compiled(literals, col_idxs, row):
+    buf = [literals[0]]
+    for j, idx in enumerate(col_idxs):
+        buf.append(str(row[idx]) if idx is not None else ""); buf.append(literals[j + 1])
+    return "".join(buf)
+
+SMTP_MAX_MSGS_PER_CONNECTION = 1000 # Recycle the session after this many sends (Gmail limit safety)
+SMTP_SEND_WORKERS = 4 # Parallel SMTP connections for bulk sends
+
+CSV_BATCH_ROWS = 1024 # Rows per batch handed from the CSV reader thread to the consumer
+CSV_QUEUE_DEPTH = 4 # Bounded queue depth: keeps memory O(batches) while prefetching
+
+TIMER_MAX_DELAY_MS = 2**31 - 1 # Tcl's 'after' takes a C int (~24.8 days); longer waits re-arm in hops
+
+
+class SMTPPool:
+    """Small pool of persistent, logged-in SMTP connections shared by the send paths.
+
+    acquire() hands out a connection after a NOOP health check, issues RSET when it
+    comes back so no envelope state leaks between messages, and retires a connection
+    once it has carried max_msgs messages. Connections are opened lazily, so a pool
+    of size N only costs N logins if N workers are actually sending."""
+
+    def __init__(self, user, password, host="smtp.gmail.com", port=587,
+                 size=SMTP_SEND_WORKERS, max_msgs=SMTP_MAX_MSGS_PER_CONNECTION):
+        self.user = user; self.password = password; self.host = host; self.port = port
+        self.max_msgs = max_msgs
+        self._q = queue.Queue()
+        for _ in range(size): self._q.put(None) # empty slots; connections open on demand
+
+    def _new_entry(self):
+        server = smtplib.SMTP(self.host, self.port); server.ehlo(); server.starttls(); server.ehlo(); server.login(self.user, self.password)
+        return [server, 0] # [connection, messages carried]
+
+    def _close_entry(self, entry):
+        if entry is not None:
+            try: entry[0].quit()
+            except Exception: pass
+        return None
+
+    @contextlib.contextmanager
+    def acquire(self):
+        entry = self._q.get()
+        try:
+            if entry is not None and entry[1] >= self.max_msgs: entry = self._close_entry(entry)
+            if entry is not None:
+                try:
+                    if entry[0].noop()[0] != 250: entry = self._close_entry(entry)
+                except Exception: entry = self._close_entry(entry)
+            if entry is None: entry = self._new_entry()
+            yield entry[0]
+            entry[1] += 1
+            try: entry[0].rset()
+            except Exception: entry = self._close_entry(entry)
+        except Exception:
+            entry = self._close_entry(entry)
+            raise
+        finally:
+            self._q.put(entry) # always return the slot, even if the connection died
+
+    def close(self):
+        while True:
+            try: entry = self._q.get_nowait()
+            except queue.Empty: break
+            self._close_entry(entry)
+
+class _WireTemplate:
+    """Precompiled RFC 5322 bytes for the fixed message shape this app sends:
+    one text/plain body plus an optional PDF attachment.
+
+    Every message in a batch shares its From/Cc headers, MIME boundary and
+    attachment bytes, so those are frozen once here; render() only splices in
+    the To/Subject headers and the base64 body before a single b"".join. That
+    skips the per-message header folding, boundary generation and payload
+    encoding email.generator would otherwise redo for every recipient."""
+
+    def __init__(self, sender_email, cc_email, cv_part):
+        # sendmail() gets these as bytes, which smtplib puts on the wire untouched
+        # (EOL normalization only happens for str payloads) - so every line ending
+        # here must already be the CRLF that RFC 5321 / Gmail require.
+        boundary = "===============%s==" % uuid.uuid4().hex
+        cc_line = f"Cc: {cc_email}\r\n" if cc_email else ""
+        self._head = (f"From: {sender_email}\r\n{cc_line}MIME-Version: 1.0\r\n"
+                      f'Content-Type: multipart/mixed; boundary="{boundary}"\r\n').encode('ascii')
+        self._text_prelude = (f'\r\n--{boundary}\r\nContent-Type: text/plain; charset="utf-8"\r\n'
+                              "MIME-Version: 1.0\r\nContent-Transfer-Encoding: base64\r\n\r\n").encode('ascii')
+        if cv_part is not None:
+            # Reuse the already-encoded attachment from the CV cache; encode_base64
+            # emits LF-separated lines, so normalize them to CRLF for the wire
+            cv_b64 = cv_part.get_payload().replace("\n", "\r\n")
+            self._tail = (f"\r\n--{boundary}\r\nContent-Type: application/octet-stream\r\n"
+                          "MIME-Version: 1.0\r\nContent-Transfer-Encoding: base64\r\n"
+                          f"Content-Disposition: {cv_part['Content-Disposition']}\r\n\r\n"
+                          f"{cv_b64}\r\n--{boundary}--\r\n").encode('ascii')
+        else:
+            self._tail = f"\r\n--{boundary}--\r\n".encode('ascii')
+
+    def render(self, recipient_email, subject, body):
+        """Return the complete wire bytes for one recipient."""
+        encoded_subject = Header(subject).encode(linesep="\r\n")
+        per_row = f"To: {recipient_email}\r\nSubject: {encoded_subject}\r\n".encode('ascii')
+        return b"".join((self._head, per_row, self._text_prelude,
+                         base64mime.body_encode(body.encode('utf-8'), eol="\r\n").encode('ascii'), self._tail))
+
 class BulkEmailerApp:
     def __init__(self, root):
         self.root = root
@@ -46,7 +189,8 @@ class BulkEmailerApp:
         self.csv_file_paths = []
         self.cv_file_path = tk.StringVar()
         self.csv_headers = []
-        self.csv_data = []
+        self.csv_data = [] # list of tuples aligned to self.csv_headers
+        self._header_index = {} # header name -> position in each row tuple
 
         self.email_column_var = tk.StringVar()
         self.column_mappings = {key: tk.StringVar() for key in DEFAULT_PLACEHOLDERS}
@@ -78,6 +222,34 @@ class BulkEmailerApp:
         self.scheduled_campaigns = self.load_scheduled_campaigns_from_file()
         self.custom_email_batch = [] # List to hold custom email dicts
 
+        # Dirty flag so save_app_config only rewrites the config file when a
+        # profile-bound value actually changed since the last save
+        self._profiles_dirty = True
+        for var in ([self.cv_file_path, self.email_column_var, self.email_subject_var,
+                     self.smtp_email_var, self.smtp_password_var, self.enable_cc_var, self.cc_email_var,
+                     self.profile_schedule_date_var, self.profile_schedule_time_var]
+                    + list(self.column_mappings.values())):
+            var.trace_add("write", self._mark_profiles_dirty)
+
+        # Pending log lines, flushed to the Tk widget in batches (see _flush_log)
+        self._log_buf = collections.deque()
+        self._log_flush_scheduled = False
+        self._log_ts_second = -1 # cached HH:MM:SS string, refreshed at most once a second
+        self._log_ts_text = ""
+
+        # Pool of persistent SMTP connections shared by bulk/test/manual sends
+        self._smtp_pool = None
+        self._smtp_pool_identity = None
+
+        # Worker threads for bulk sends; connections come from the pool above
+        self._send_executor = concurrent.futures.ThreadPoolExecutor(max_workers=SMTP_SEND_WORKERS)
+        self._msg_local = threading.local() # per-thread reusable message skeleton
+
+        # (path, mtime, size) -> pre-encoded CV MIME part, so the PDF is read and
+        # base64-encoded once per batch instead of once per recipient
+        self._cached_cv_part = None
+        self._cached_cv_stat = None
+
         self.load_app_config()
         self.create_widgets()
 
@@ -90,8 +262,9 @@ class BulkEmailerApp:
         self.load_profile_data(self.active_profile_name.get()) # This will now load profile's schedule too
         self.update_column_mapping_dropdowns_state()
 
+        self._schedule_after_ids = {} # campaign_id -> pending root.after timer id
         self.root.after(2000, self.check_for_pending_scheduled_jobs)
-        self.root.after(60000, self.periodic_schedule_check)
+        self.root.after(2500, self._arm_pending_campaign_timers)
 
 
     def get_default_profile_settings(self):
@@ -111,18 +284,38 @@ class BulkEmailerApp:
             "enable_cc": False, "cc_email": "" # Added CC settings
         }
 
+    def _mark_profiles_dirty(self, *args):
+        self._profiles_dirty = True
+
+    def _on_body_modified(self, event=None):
+        self._profiles_dirty = True
+        if self.email_body_text_widget: self.email_body_text_widget.edit_modified(False)
+
     def save_app_config(self):
         self.save_current_profile_data_to_object()
+        if not self._profiles_dirty:
+            self.log_message("Configuration unchanged since last save; skipping write."); return
         app_config = {"active_profile_name": self.active_profile_name.get(), "profiles": self.profiles}
         try:
-            with open(CONFIG_FILE, "w") as f: json.dump(app_config, f, indent=4)
+            if orjson is not None: data = orjson.dumps(app_config, option=orjson.OPT_INDENT_2)
+            else: data = json.dumps(app_config, indent=4).encode("utf-8")
+            tmp_path = CONFIG_FILE + ".tmp"
+            with open(tmp_path, "wb") as f: f.write(data)
+            os.replace(tmp_path, CONFIG_FILE) # atomic: a crash can't leave a half-written config
+            self._write_config_cache(os.stat(CONFIG_FILE).st_mtime, app_config)
+            self._profiles_dirty = False
             self.log_message("Application configuration (all profiles) saved.")
         except Exception as e: self.log_message(f"Error saving application configuration: {e}", error=True)
 
     def load_app_config(self):
         try:
             if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, "r") as f: app_config = json.load(f)
+                mtime = os.stat(CONFIG_FILE).st_mtime
+                app_config = self._load_config_cache(mtime)
+                if app_config is None:
+                    with open(CONFIG_FILE, "rb") as f: raw = f.read()
+                    app_config = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                    self._write_config_cache(mtime, app_config)
                 self.active_profile_name.set(app_config.get("active_profile_name", DEFAULT_PROFILE_NAME))
                 self.profiles = app_config.get("profiles", {})
                 if not self.profiles:
@@ -143,7 +336,23 @@ class BulkEmailerApp:
             self.profiles = {DEFAULT_PROFILE_NAME: self.get_default_profile_settings()}
             self.profile_keys_for_dropdown = [DEFAULT_PROFILE_NAME]
 
+    def _load_config_cache(self, mtime):
+        """Return the cached parsed config if the pickle matches the JSON's mtime, else None."""
+        try:
+            with open(CONFIG_CACHE_FILE, "rb") as f: cached_mtime, app_config = pickle.load(f)
+            if cached_mtime == mtime: return app_config
+        except Exception: pass
+        return None
+
+    def _write_config_cache(self, mtime, app_config):
+        try:
+            with open(CONFIG_CACHE_FILE, "wb") as f: pickle.dump((mtime, app_config), f, pickle.HIGHEST_PROTOCOL)
+        except Exception: pass # cache is best-effort; JSON remains the source of truth
+
     def save_current_profile_data_to_object(self):
+        # The dirty flag is set by trace_add/<<Modified>> callbacks; when clean there is
+        # nothing to copy, and the ScrolledText .get() below would duplicate the whole body.
+        if not self._profiles_dirty: return
         profile_name = self.active_profile_name.get()
         if not profile_name or profile_name not in self.profiles: return
         if profile_name not in self.profiles: self.profiles[profile_name] = self.get_default_profile_settings()
@@ -226,8 +435,7 @@ class BulkEmailerApp:
                 new_profile_settings["cc_email"] = active_profile_data.get("cc_email", "")
                 self.log_message(f"New profile '{profile_name}' inherited SMTP, Schedule, and CC from '{current_active_profile_name_for_inheritance}'.")
         self.profiles[profile_name] = new_profile_settings
-        self.profile_keys_for_dropdown = list(self.profiles.keys())
-        self.update_profile_dropdown()
+        self._add_profile_menu_entry(profile_name)
         if make_active:
             self.active_profile_name.set(profile_name); self.load_profile_data(profile_name)
         self.log_message(f"Profile '{profile_name}' created.")
@@ -240,14 +448,30 @@ class BulkEmailerApp:
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete profile '{profile_name_to_delete}'? This cannot be undone."):
             if profile_name_to_delete in self.profiles:
                 del self.profiles[profile_name_to_delete]
-                self.profile_keys_for_dropdown = list(self.profiles.keys())
+                self._remove_profile_menu_entry(profile_name_to_delete)
                 new_active = DEFAULT_PROFILE_NAME if DEFAULT_PROFILE_NAME in self.profiles else (self.profile_keys_for_dropdown[0] if self.profile_keys_for_dropdown else "")
-                self.active_profile_name.set(new_active); self.update_profile_dropdown()
+                self.active_profile_name.set(new_active)
                 if new_active: self.load_profile_data(new_active)
                 else: self.create_new_profile(DEFAULT_PROFILE_NAME, make_active=True, initial_setup=True)
                 self.log_message(f"Profile '{profile_name_to_delete}' deleted."); self.save_app_config()
 
+    def _add_profile_menu_entry(self, profile_key):
+        """Append a single profile to the dropdown instead of rebuilding the whole menu."""
+        self.profile_keys_for_dropdown.append(profile_key)
+        if hasattr(self, 'profile_menu'):
+            self.profile_menu['menu'].add_command(label=profile_key, command=lambda pk=profile_key: self.set_and_load_profile(pk))
+
+    def _remove_profile_menu_entry(self, profile_key):
+        """Remove a single profile from the dropdown. Menu entries were added in list
+        order, so the list index doubles as the Tk menu index."""
+        try: index = self.profile_keys_for_dropdown.index(profile_key)
+        except ValueError: return
+        del self.profile_keys_for_dropdown[index]
+        if hasattr(self, 'profile_menu'): self.profile_menu['menu'].delete(index)
+
     def update_profile_dropdown(self):
+        # Full rebuild; only needed at widget creation time — incremental changes go
+        # through _add_profile_menu_entry/_remove_profile_menu_entry
         if not hasattr(self, 'profile_menu'): return
         menu = self.profile_menu['menu']; menu.delete(0, 'end')
         if not self.profile_keys_for_dropdown and DEFAULT_PROFILE_NAME not in self.profiles:
@@ -269,18 +493,43 @@ class BulkEmailerApp:
         main_container = ttk.Frame(self.root); main_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.notebook = ttk.Notebook(main_container); self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        tab_profile_csv = ttk.Frame(self.notebook, padding=10); self.notebook.add(tab_profile_csv, text='Profiles & CSV'); self.create_tab_profile_csv(tab_profile_csv)
-        tab_mapping = ttk.Frame(self.notebook, padding=10); self.notebook.add(tab_mapping, text='Column Mapping'); self.create_tab_mapping(tab_mapping)
-        tab_email_content = ttk.Frame(self.notebook, padding=10); self.notebook.add(tab_email_content, text='Email Content'); self.create_tab_email_content(tab_email_content)
-        tab_custom_batch = ttk.Frame(self.notebook, padding=10); self.notebook.add(tab_custom_batch, text='Batch Custom Emails'); self.create_tab_custom_batch(tab_custom_batch)
-        tab_manual_send = ttk.Frame(self.notebook, padding=10); self.notebook.add(tab_manual_send, text='Manual Send'); self.create_tab_manual_send(tab_manual_send)
-        tab_settings_send = ttk.Frame(self.notebook, padding=10); self.notebook.add(tab_settings_send, text='Settings & Send'); self.create_tab_settings_send(tab_settings_send)
+        # Tabs are registered empty and their contents built on first visit; only the
+        # initially visible page is constructed up front
+        self._tab_builders = {}; self._built_tabs = set()
+        tab_definitions = (('Profiles & CSV', self.create_tab_profile_csv), ('Column Mapping', self.create_tab_mapping),
+                           ('Email Content', self.create_tab_email_content), ('Batch Custom Emails', self.create_tab_custom_batch),
+                           ('Manual Send', self.create_tab_manual_send), ('Settings & Send', self.create_tab_settings_send))
+        first_tab_id = None
+        for tab_text, tab_builder in tab_definitions:
+            tab_frame = ttk.Frame(self.notebook, padding=10); self.notebook.add(tab_frame, text=tab_text)
+            self._tab_builders[str(tab_frame)] = (tab_frame, tab_builder)
+            if first_tab_id is None: first_tab_id = str(tab_frame)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_shown)
+        self._build_tab(first_tab_id)
 
         log_frame = ttk.LabelFrame(main_container, text="Log", padding=10); log_frame.pack(fill=tk.X, padx=5, pady=(10,5), side=tk.BOTTOM)
         self.log_text = scrolledtext.ScrolledText(log_frame, wrap=tk.WORD, height=5, state='disabled', font=("Helvetica", 9)); self.log_text.pack(fill=tk.X, expand=False)
+        self.log_text.tag_config("error_tag", foreground="red"); self.log_text.tag_config("info_tag", foreground="black")
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.update_profile_dropdown()
 
+    def _build_tab(self, tab_id):
+        if tab_id in self._built_tabs: return
+        tab_frame, tab_builder = self._tab_builders[tab_id]
+        self._built_tabs.add(tab_id)
+        tab_builder(tab_frame)
+
+    def _on_tab_shown(self, event=None):
+        try: self._build_tab(self.notebook.select())
+        except (KeyError, tk.TclError): pass
+
+    def _get_body_template(self):
+        """Body template text: from the editor when it exists, else the stored profile
+        value (the Email Content tab may not have been built yet)."""
+        if self.email_body_text_widget: return self.email_body_text_widget.get("1.0", tk.END)
+        profile = self.profiles.get(self.active_profile_name.get(), {})
+        return profile.get("email_body", "")
+
     def create_tab_profile_csv(self, parent_tab):
         profile_frame = ttk.LabelFrame(parent_tab, text="User Profiles", padding=10); profile_frame.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
         ttk.Label(profile_frame, text="Active Profile:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
@@ -326,6 +575,13 @@ class BulkEmailerApp:
         ttk.Label(email_template_frame, text="Body:").grid(row=1, column=0, padx=5, pady=5, sticky="nw")
         self.email_body_text_widget = scrolledtext.ScrolledText(email_template_frame, wrap=tk.WORD, height=15, width=80, font=("Helvetica", 10))
         self.email_body_text_widget.grid(row=1, column=1, padx=5, pady=5, sticky="nsew")
+        # Deferred build: load_profile_data ran before this widget existed, so seed the
+        # editor with the active profile's body here (otherwise it stays blank and the
+        # next auto-save would write that blank back over the stored template).
+        profile_data = self.profiles.get(self.active_profile_name.get(), {})
+        self.email_body_text_widget.insert("1.0", profile_data.get("email_body", self.get_default_profile_settings()["email_body"]))
+        self.email_body_text_widget.edit_modified(False) # seeding is not a user edit; don't mark dirty
+        self.email_body_text_widget.bind("<<Modified>>", self._on_body_modified)
 
         # Frame for action buttons below the text widget
         action_button_frame = ttk.Frame(email_template_frame)
@@ -425,61 +681,130 @@ class BulkEmailerApp:
     def on_closing(self):
         self.log_message("Closing application. Auto-saving all profiles and settings...")
         self.save_app_config(); self.save_scheduled_campaigns_to_file()
+        self._send_executor.shutdown(wait=False)
+        self._close_smtp_pool()
         self.root.destroy()
 
     def log_message(self, message, error=False):
         if not hasattr(self, 'log_text') or self.log_text is None: print(f"LOG ({'ERROR' if error else 'INFO'}): {message}"); return
+        self._log_buf.append((self._log_timestamp(), message, error))
+        if len(self._log_buf) >= 50:
+            self._flush_log() # keep the log moving while a blocking bulk send holds the event loop
+        elif not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            try: self.root.after(100, self._flush_log)
+            except tk.TclError: self._flush_log()
+
+    def _log_timestamp(self):
+        """HH:MM:SS for log lines, re-formatted only when the second ticks over —
+        avoids a datetime allocation + strftime per message on the hot log path."""
+        now = int(time.time())
+        if now != self._log_ts_second:
+            self._log_ts_second = now; self._log_ts_text = time.strftime('%H:%M:%S')
+        return self._log_ts_text
+
+    def _flush_log(self):
+        """Drain the pending log lines into the widget in one go. Inserting per batch
+        instead of per message avoids a Tk re-layout for every line of a bulk send."""
+        self._log_flush_scheduled = False
+        if not self._log_buf: return
         try:
             self.log_text.config(state='normal')
-            self.log_text.insert(tk.END, f"{datetime.datetime.now().strftime('%H:%M:%S')} - {message}\n", "error_tag" if error else "info_tag")
-            self.log_text.tag_config("error_tag", foreground="red"); self.log_text.tag_config("info_tag", foreground="black")
+            while self._log_buf:
+                ts, message, error = self._log_buf.popleft()
+                self.log_text.insert(tk.END, f"{ts} - {message}\n", "error_tag" if error else "info_tag")
             self.log_text.see(tk.END); self.log_text.config(state='disabled')
-            if self.root and self.root.winfo_exists(): self.root.update_idletasks()
-        except tk.TclError: print(f"LOG (TclError suppressed): {message}")
+        except tk.TclError: print(f"LOG (TclError suppressed): {len(self._log_buf)} pending message(s)")
 
     def _auto_detect_columns(self):
         if not self.csv_headers: return
+        # Single pass over the headers; first hit per mapping key wins
+        detected_headers = {}
+        for header in self.csv_headers:
+            key = _HEADER_LOOKUP.get(header.lower().replace(" ", "").replace("_", ""))
+            if key is not None and key not in detected_headers: detected_headers[key] = header
         current_email_col_setting = self.email_column_var.get()
         if not current_email_col_setting or current_email_col_setting not in self.csv_headers:
-            detected = False
-            for header in self.csv_headers:
-                if header.lower().replace(" ", "").replace("_", "") in AUTO_DETECT_PATTERNS["email_column"]:
-                    self.email_column_var.set(header); self.log_message(f"Auto-detected Email column: '{header}'"); detected = True; break
-        for key, patterns in AUTO_DETECT_PATTERNS.items():
+            if "email_column" in detected_headers:
+                header = detected_headers["email_column"]
+                self.email_column_var.set(header); self.log_message(f"Auto-detected Email column: '{header}'")
+        for key in AUTO_DETECT_PATTERNS:
             if key == "email_column": continue
             current_mapping = self.column_mappings[key].get()
             if not current_mapping or current_mapping == "Not Mapped" or current_mapping not in self.csv_headers:
-                detected_placeholder = False
-                for header in self.csv_headers:
-                    normalized_header = header.lower().replace(" ", "").replace("_", "")
-                    if normalized_header in patterns:
-                        self.column_mappings[key].set(header); self.log_message(f"Auto-detected {key.replace('_',' ').title()} column: '{header}'"); detected_placeholder = True; break
-                if not detected_placeholder and self.column_mappings[key].get() not in self.csv_headers: self.column_mappings[key].set("Not Mapped")
+                if key in detected_headers:
+                    header = detected_headers[key]
+                    self.column_mappings[key].set(header); self.log_message(f"Auto-detected {key.replace('_',' ').title()} column: '{header}'")
+                elif self.column_mappings[key].get() not in self.csv_headers: self.column_mappings[key].set("Not Mapped")
         self.update_column_mapping_dropdowns()
 
+    def _row_value(self, row, header, default=None):
+        idx = self._header_index.get(header)
+        return row[idx] if idx is not None else default
+
     def _load_csv_data_from_paths(self, file_paths, silent=False):
         self.csv_data = []; combined_headers = set(); all_rows = []
-        if not file_paths: self.csv_headers = []; self.csv_paths_label.config(text="No CSVs loaded."); self.update_column_mapping_dropdowns(); return True
+        if not file_paths: self.csv_headers = []; self._header_index = {}; self.csv_paths_label.config(text="No CSVs loaded."); self.update_column_mapping_dropdowns(); return True
+        # Pass 1: just the header line of each file, so the combined column layout is known up front
+        file_headers = {}
         for file_path in file_paths:
             try:
                 with open(file_path, mode='r', encoding='utf-8-sig', newline='') as file:
-                    reader = csv.DictReader(file)
-                    if not reader.fieldnames:
-                        if not silent: messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' is empty or has no headers. Skipping.")
-                        continue
-                    current_file_rows = list(reader)
-                    if not current_file_rows and not silent: messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' has headers but no data rows.")
-                    all_rows.extend(current_file_rows)
-                    for header in reader.fieldnames: combined_headers.add(header)
-                if not silent: self.log_message(f"Successfully processed {os.path.basename(file_path)}.")
+                    headers = next(csv.reader(file), None)
+                if not headers:
+                    if not silent: messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' is empty or has no headers. Skipping.")
+                    continue
+                file_headers[file_path] = headers; combined_headers.update(headers)
             except Exception as e:
                 if not silent: messagebox.showerror("CSV Error", f"Failed to load/parse {os.path.basename(file_path)}: {e}"); self.log_message(f"Failed to load {os.path.basename(file_path)}: {e}", error=True)
-        self.csv_headers = sorted(list(combined_headers)); self.csv_data = all_rows
+        self.csv_headers = sorted(list(combined_headers))
+        self._header_index = {h: i for i, h in enumerate(self.csv_headers)}
+        n_cols = len(self.csv_headers)
+        # Pass 2: a background thread parses and prefetches row batches while this
+        # (Tk) thread drains them, so reading file N+1 overlaps consuming file N
+        row_queue = queue.Queue(maxsize=CSV_QUEUE_DEPTH)
+        producer = threading.Thread(target=self._csv_producer, args=(file_headers, self._header_index, n_cols, row_queue), daemon=True)
+        producer.start()
+        rows_per_file = {file_path: 0 for file_path in file_headers}
+        while True:
+            item = row_queue.get()
+            if item is None: break
+            kind, file_path, payload = item
+            if kind == 'rows':
+                all_rows.extend(payload); rows_per_file[file_path] += len(payload)
+            elif kind == 'done':
+                if rows_per_file[file_path] == 0 and not silent: messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' has headers but no data rows.")
+                if not silent: self.log_message(f"Successfully processed {os.path.basename(file_path)}.")
+            else: # 'error'
+                if not silent: messagebox.showerror("CSV Error", f"Failed to load/parse {os.path.basename(file_path)}: {payload}"); self.log_message(f"Failed to load {os.path.basename(file_path)}: {payload}", error=True)
+        self.csv_data = all_rows
         if not self.csv_data and not silent and file_paths: self.log_message("Warning: All loaded CSVs combined resulted in no data rows.", error=False)
         elif self.csv_data: self.log_message(f"Total {len(self.csv_data)} rows loaded from {len(file_paths)} CSV file(s).")
         self.csv_paths_label.config(text=f"{len(file_paths)} CSV(s) loaded: " + ", ".join([os.path.basename(p) for p in file_paths]) if file_paths else "No CSVs loaded.")
         self._auto_detect_columns(); return True
 
+    def _csv_producer(self, file_headers, header_index, n_cols, out_queue):
+        """Reader thread: streams each CSV in large-buffer mode and feeds aligned
+        row-tuple batches into the bounded queue. Terminates with a None sentinel."""
+        for file_path, headers in file_headers.items():
+            try:
+                col_targets = [header_index[h] for h in headers]
+                with open(file_path, mode='r', encoding='utf-8-sig', newline='', buffering=1 << 20) as file:
+                    reader = csv.reader(file); next(reader, None) # skip header line
+                    while True:
+                        raw_rows = list(itertools.islice(reader, CSV_BATCH_ROWS))
+                        if not raw_rows: break
+                        batch = []
+                        for raw_row in raw_rows:
+                            row = [""] * n_cols
+                            for value, target in zip(raw_row, col_targets): row[target] = value
+                            batch.append(tuple(row))
+                        out_queue.put(('rows', file_path, batch))
+                out_queue.put(('done', file_path, None))
+            except Exception as e:
+                out_queue.put(('error', file_path, e))
+        out_queue.put(None)
+
     def load_csv_files(self):
         filepaths = filedialog.askopenfilenames(title="Select CSV Files", filetypes=(("CSV files", "*.csv"), ("All files", "*.*")))
         if filepaths: self.csv_file_paths = list(filepaths); self._load_csv_data_from_paths(self.csv_file_paths)
@@ -513,7 +838,7 @@ class BulkEmailerApp:
 
     def _is_valid_email(self, email_string):
         if not email_string or not isinstance(email_string, str): return False
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"; return re.match(pattern, email_string) is not None
+        return _EMAIL_RE.fullmatch(email_string) is not None
 
     def _validate_schedule_datetime(self, date_str, time_str):
         if not date_str and not time_str: return None
@@ -525,35 +850,33 @@ class BulkEmailerApp:
             return "Invalid"
 
     def preview_email(self, manual_mode=False, custom_email_data=None):
-        if self.email_body_text_widget is None: messagebox.showerror("Error", "Email body editor not available."); return
         subject_template = self.email_subject_var.get()
-        body_template = self.email_body_text_widget.get("1.0", tk.END)
+        body_template = self._get_body_template()
         preview_fill_data = {}
         if custom_email_data:
             if custom_email_data["use_template"]:
-                for key, placeholder_text in DEFAULT_PLACEHOLDERS.items():
-                    preview_fill_data[placeholder_text] = custom_email_data["template_placeholders"].get(key, f"[{key}_MISSING]")
+                for key in DEFAULT_PLACEHOLDERS:
+                    preview_fill_data[key] = custom_email_data["template_placeholders"].get(key, f"[{key}_MISSING]")
             else:
                 subject_template = custom_email_data["subject"]
                 body_template = custom_email_data["body"]
         elif manual_mode:
-            preview_fill_data[DEFAULT_PLACEHOLDERS["FIRST_NAME"]] = self.manual_first_name_var.get() or "[MANUAL_FIRST_NAME]"
-            preview_fill_data[DEFAULT_PLACEHOLDERS["LAST_NAME"]] = ""
-            preview_fill_data[DEFAULT_PLACEHOLDERS["COMPANY_NAME"]] = self.manual_company_name_var.get() or "[MANUAL_COMPANY_NAME]"
-            preview_fill_data[DEFAULT_PLACEHOLDERS["ROLE"]] = self.manual_role_var.get() or "[MANUAL_ROLE]"
+            preview_fill_data["FIRST_NAME"] = self.manual_first_name_var.get() or "[MANUAL_FIRST_NAME]"
+            preview_fill_data["LAST_NAME"] = ""
+            preview_fill_data["COMPANY_NAME"] = self.manual_company_name_var.get() or "[MANUAL_COMPANY_NAME]"
+            preview_fill_data["ROLE"] = self.manual_role_var.get() or "[MANUAL_ROLE]"
         else:
             if not self.csv_data: messagebox.showinfo("Preview Info", "Load CSV data to preview bulk email."); return
             first_row = self.csv_data[0]
-            for key, placeholder in DEFAULT_PLACEHOLDERS.items():
+            for key in DEFAULT_PLACEHOLDERS:
                 csv_col_name = self.column_mappings[key].get()
-                if csv_col_name and csv_col_name != "Not Mapped" and csv_col_name in first_row:
-                    preview_fill_data[placeholder] = first_row[csv_col_name]
-                else: preview_fill_data[placeholder] = f"[{key.upper()}_DATA]"
+                if csv_col_name and csv_col_name != "Not Mapped" and csv_col_name in self._header_index:
+                    preview_fill_data[key] = self._row_value(first_row, csv_col_name)
+                else: preview_fill_data[key] = f"[{key.upper()}_DATA]"
         final_subject = subject_template; final_body = body_template
         if not custom_email_data or custom_email_data["use_template"]:
-            for placeholder, value in preview_fill_data.items():
-                final_subject = final_subject.replace(placeholder, str(value))
-                final_body = final_body.replace(placeholder, str(value))
+            final_subject = _render_template(final_subject, preview_fill_data)
+            final_body = _render_template(final_body, preview_fill_data)
         preview_window = tk.Toplevel(self.root); preview_window.title("Email Preview"); preview_window.geometry("600x450")
         preview_window.transient(self.root); preview_window.grab_set()
         ttk.Label(preview_window, text="Subject:", font=("Helvetica", 11, "bold")).pack(pady=(10,2), anchor="w", padx=10)
@@ -565,6 +888,71 @@ class BulkEmailerApp:
         body_prev_text.pack(pady=(0,10), padx=10, fill=tk.BOTH, expand=True)
         ttk.Button(preview_window, text="Close", command=preview_window.destroy).pack(pady=10)
 
+    def _get_smtp_pool(self, sender_email, sender_password):
+        """Return the shared SMTPPool, rebuilding it when the credentials change."""
+        identity = (sender_email, sender_password)
+        if self._smtp_pool is not None and self._smtp_pool_identity != identity:
+            self._close_smtp_pool()
+        if self._smtp_pool is None:
+            self._smtp_pool = SMTPPool(sender_email, sender_password)
+            self._smtp_pool_identity = identity
+        return self._smtp_pool
+
+    def _close_smtp_pool(self):
+        if self._smtp_pool is not None:
+            self._smtp_pool.close()
+            self._smtp_pool = None; self._smtp_pool_identity = None
+
+    def _get_message_skeleton(self, sender_email, cv_path):
+        """Per-thread reusable message skeleton: the multipart container, body part and
+        CV attachment are allocated once; per row only headers and the body payload change."""
+        local = self._msg_local
+        cv_part = None
+        if cv_path and os.path.exists(cv_path) and cv_path.lower().endswith(".pdf"):
+            cv_part = self._get_cv_part(cv_path)
+        key = (sender_email, self._cached_cv_stat if cv_part is not None else None)
+        if getattr(local, 'key', None) != key:
+            msg = MIMEMultipart(); msg['From'] = sender_email
+            body_part = MIMEText("", 'plain', 'utf-8') # fixes Content-Type/CTE headers once
+            msg.attach(body_part)
+            if cv_part is not None: msg.attach(copy.copy(cv_part))
+            local.msg = msg; local.body_part = body_part; local.key = key
+        return local.msg, local.body_part
+
+    def _build_message(self, email_details, sender_email, cv_path, enable_cc, cc_email):
+        """Prepare the reusable MIME message for one recipient; returns (msg, all_recipients)."""
+        msg, body_part = self._get_message_skeleton(sender_email, cv_path)
+        recipient_email = email_details['recipient_email']
+        del msg['To']; del msg['Subject']; del msg['Cc']
+        msg['To'] = recipient_email; msg['Subject'] = email_details['subject']
+        all_recipients = [recipient_email]
+        if enable_cc and cc_email and self._is_valid_email(cc_email):
+            msg['Cc'] = cc_email
+            all_recipients.append(cc_email)
+        # Payload is swapped pre-encoded so the skeleton's base64 CTE header stays truthful
+        body_part.set_payload(base64mime.body_encode(email_details['body'].encode('utf-8')))
+        return msg, all_recipients
+
+    def _get_cv_part(self, cv_path):
+        """Return the base64-encoded CV attachment, rebuilt only when the file changes on disk."""
+        st = os.stat(cv_path)
+        stat_key = (cv_path, st.st_mtime, st.st_size)
+        if self._cached_cv_stat != stat_key:
+            with open(cv_path, "rb") as attachment_file: part = MIMEBase('application', 'octet-stream'); part.set_payload(attachment_file.read())
+            encoders.encode_base64(part); part.add_header('Content-Disposition', f"attachment; filename= {os.path.basename(cv_path)}")
+            self._cached_cv_part = part; self._cached_cv_stat = stat_key
+        return self._cached_cv_part
+
+    def _send_one(self, server, email_details, sender_email, cv_path, enable_cc, cc_email):
+        msg, all_recipients = self._build_message(email_details, sender_email, cv_path, enable_cc, cc_email)
+        server.sendmail(sender_email, all_recipients, msg.as_string())
+
+    def _send_one_threaded(self, pool, wire, email_details, sender_email, all_recipients):
+        payload = wire.render(email_details['recipient_email'], email_details['subject'], email_details['body'])
+        with pool.acquire() as server:
+            server.sendmail(sender_email, [email_details['recipient_email']] + all_recipients, payload)
+        time.sleep(0.05) # polite per-connection pacing towards Gmail
+
     def _perform_email_sending(self, emails_to_send_list, is_test=False, is_custom_batch=False):
         cv_path = self.cv_file_path.get(); sender_email = self.smtp_email_var.get(); sender_password = self.smtp_password_var.get()
         enable_cc = self.enable_cc_var.get()
@@ -575,55 +963,67 @@ class BulkEmailerApp:
         elif not is_test and cv_path and not cv_path.lower().endswith(".pdf"):
              self.log_message(f"CV file '{cv_path}' is not a PDF. Sending without CV.", error=True); cv_path = None
         
-        progress_bar_to_use = self.custom_batch_progress_bar if is_custom_batch else self.progress_bar
-        send_button_to_use = self.custom_batch_send_button if is_custom_batch else self.send_button
+        progress_bar_to_use = getattr(self, 'custom_batch_progress_bar' if is_custom_batch else 'progress_bar', None)
+        send_button_to_use = getattr(self, 'custom_batch_send_button' if is_custom_batch else 'send_button', None)
 
         self.log_message(f"Starting SMTP process for {len(emails_to_send_list)} email(s)...")
         if hasattr(send_button_to_use, 'config'): send_button_to_use.config(state=tk.DISABLED)
         if hasattr(progress_bar_to_use, 'config'): progress_bar_to_use['value'] = 0; progress_bar_to_use['maximum'] = len(emails_to_send_list) if emails_to_send_list else 1
         sent_count = 0; failed_count = 0
         try:
-            server = smtplib.SMTP("smtp.gmail.com", 587); server.ehlo(); server.starttls(); server.ehlo(); server.login(sender_email, sender_password)
-            self.log_message("Logged into Gmail SMTP server.")
-            for i, email_details in enumerate(emails_to_send_list):
-                recipient_email = email_details['recipient_email']; current_subject = email_details['subject']; current_body = email_details['body']
-                row_identifier = email_details.get('row_identifier', f"item {i+1}")
-                
-                msg = MIMEMultipart(); msg['From'] = sender_email; msg['To'] = recipient_email; msg['Subject'] = current_subject
-                
-                all_recipients = [recipient_email]
-                if enable_cc and cc_email and self._is_valid_email(cc_email):
-                    msg['Cc'] = cc_email
-                    all_recipients.append(cc_email)
-
-                msg.attach(MIMEText(current_body, 'plain', 'utf-8'))
-
-                if cv_path and os.path.exists(cv_path) and cv_path.lower().endswith(".pdf"): 
+            pool = self._get_smtp_pool(sender_email, sender_password)
+            if len(emails_to_send_list) <= 1 or is_test:
+                # Single/test sends: keep the simple serial path on a pooled session
+                for i, email_details in enumerate(emails_to_send_list):
+                    with pool.acquire() as server:
+                        self._send_one(server, email_details, sender_email, cv_path, enable_cc, cc_email)
+                    self.log_message(f"Email sent to {email_details['recipient_email']} ({email_details.get('row_identifier', f'item {i+1}')})"); sent_count += 1
+                    if not is_test: self.update_progress(i + 1, is_custom_batch, total=len(emails_to_send_list))
+            else:
+                # Bulk sends: fan out across the worker threads; each borrows a pooled
+                # persistent SMTP connection per message. Workers only touch the network;
+                # all logging/progress happens here on the Tk thread.
+                valid_cc = cc_email if enable_cc and cc_email and self._is_valid_email(cc_email) else None
+                cv_part = self._get_cv_part(cv_path) if cv_path else None
+                wire = _WireTemplate(sender_email, valid_cc, cv_part)
+                extra_recipients = [valid_cc] if valid_cc else []
+                futures = {}
+                for email_details in emails_to_send_list:
+                    futures[self._send_executor.submit(self._send_one_threaded, pool, wire, email_details, sender_email, extra_recipients)] = email_details
+                completed = 0; auth_failed = False
+                for future in concurrent.futures.as_completed(futures):
+                    email_details = futures[future]; completed += 1
+                    row_identifier = email_details.get('row_identifier', '')
                     try:
-                        with open(cv_path, "rb") as attachment_file: part = MIMEBase('application', 'octet-stream'); part.set_payload(attachment_file.read())
-                        encoders.encode_base64(part); part.add_header('Content-Disposition', f"attachment; filename= {os.path.basename(cv_path)}"); msg.attach(part)
+                        future.result()
+                        self.log_message(f"Email sent to {email_details['recipient_email']} ({row_identifier})"); sent_count += 1
+                    except smtplib.SMTPAuthenticationError:
+                        failed_count += 1
+                        if not auth_failed:
+                            auth_failed = True
+                            err = "SMTP Auth Error. Check Gmail & App Password."; self.log_message(err, error=True); messagebox.showerror("SMTP Auth Error", err)
+                            for pending in futures: pending.cancel()
                     except Exception as e:
-                        self.log_message(f"Failed to attach CV for {recipient_email} ({row_identifier}): {e}", error=True)
-                        if not is_test: failed_count += 1; self.update_progress(i + 1, is_custom_batch); continue 
-                try:
-                    server.sendmail(sender_email, all_recipients, msg.as_string()) # Use all_recipients here
-                    self.log_message(f"Email sent to {recipient_email} ({row_identifier})"); sent_count += 1
-                except Exception as e:
-                    self.log_message(f"Failed to send email to {recipient_email} ({row_identifier}): {e}", error=True)
-                    if not is_test: failed_count += 1
-                if not is_test: self.update_progress(i + 1, is_custom_batch)
-                time.sleep(0.05) 
-            server.quit(); self.log_message("Disconnected from SMTP server.")
+                        self.log_message(f"Failed to send email to {email_details['recipient_email']} ({row_identifier}): {e}", error=True)
+                        failed_count += 1
+                    if not is_test: self.update_progress(completed, is_custom_batch, total=len(emails_to_send_list))
+            self.log_message("Batch complete. SMTP connection(s) kept open for reuse.")
         except smtplib.SMTPAuthenticationError: err = "SMTP Auth Error. Check Gmail & App Password."; self.log_message(err, error=True); messagebox.showerror("SMTP Auth Error", err);
         except smtplib.SMTPConnectError: err = "SMTP Connection Error. Check internet."; self.log_message(err, error=True); messagebox.showerror("SMTP Connection Error", err);
-        except Exception as e: self.log_message(f"Unexpected error during sending: {e}", error=True); messagebox.showerror("Sending Error", f"Unexpected error: {e}")
+        except Exception as e:
+            self._close_smtp_pool() # Connection state is unknown; force clean reconnects next time
+            self.log_message(f"Unexpected error during sending: {e}", error=True); messagebox.showerror("Sending Error", f"Unexpected error: {e}")
         finally:
             self.log_message(f"Process finished. Sent: {sent_count}, Failed: {failed_count if not is_test else 'N/A for test'}.")
             if hasattr(send_button_to_use, 'config'): send_button_to_use.config(state=tk.NORMAL)
             if hasattr(progress_bar_to_use, 'config') and not is_test and emails_to_send_list : progress_bar_to_use['value'] = progress_bar_to_use['maximum'] 
 
-    def update_progress(self, current_step, is_custom_batch=False):
-        progress_bar_to_use = self.custom_batch_progress_bar if is_custom_batch else self.progress_bar
+    def update_progress(self, current_step, is_custom_batch=False, total=None):
+        # Cap redraws at ~200 per batch; per-message Tk redraws dominate on fast sends
+        if total:
+            step = max(1, total // 200)
+            if current_step % step and current_step != total: return
+        progress_bar_to_use = getattr(self, 'custom_batch_progress_bar' if is_custom_batch else 'progress_bar', None)
         if hasattr(progress_bar_to_use, 'config'):
             progress_bar_to_use['value'] = current_step
             if self.root and self.root.winfo_exists(): self.root.update_idletasks()
@@ -649,7 +1049,7 @@ class BulkEmailerApp:
             if not sender_email_for_campaign or not sender_password_for_campaign: messagebox.showerror("Error", "Gmail address or App Password not set in active profile."); return
             if not self._is_valid_email(sender_email_for_campaign): messagebox.showerror("Error", "Invalid sender Gmail address format."); return
             subject_template = self.email_subject_var.get()
-            body_template = self.email_body_text_widget.get("1.0", tk.END) if self.email_body_text_widget else ""
+            body_template = self._get_body_template()
             if not subject_template or not body_template.strip(): messagebox.showerror("Error", "Email subject or body empty in active profile."); return
             if cv_path_for_campaign and not os.path.exists(cv_path_for_campaign):
                 if not messagebox.askyesno("CV Path Invalid", f"CV path invalid:\n'{cv_path_for_campaign}'\nContinue without CV?"): return
@@ -658,17 +1058,21 @@ class BulkEmailerApp:
                 messagebox.showerror("Error", "CV file must be a PDF."); return
             elif not cv_path_for_campaign: self.log_message("No CV selected. Emails will be sent without attachments.", error=False)
 
+            email_col_idx = self._header_index[email_col_name]
+            # Only materialize values for placeholders the templates actually use; a
+            # placeholder-free template skips rendering entirely (subject/body constant).
+            subject_lits, subject_keys = _compile_template(subject_template)
+            body_lits, body_keys = _compile_template(body_template)
+            placeholder_cols = {key: self._header_index.get(self.column_mappings[key].get()) for key in set(subject_keys) | set(body_keys)}
+            # Placeholder keys resolved to row-tuple positions once; per row it's a plain join
+            subject_idxs = [placeholder_cols[key] for key in subject_keys]
+            body_idxs = [placeholder_cols[key] for key in body_keys]
             for i, row_data in enumerate(self.csv_data):
-                recipient_email = row_data.get(email_col_name)
+                recipient_email = row_data[email_col_idx]
                 if not recipient_email or not self._is_valid_email(recipient_email):
                     self.log_message(f"Skipping row {i+1}: Invalid/missing email '{recipient_email}'.", error=True); continue
-                current_subject = subject_template; current_body = body_template
-                for key, placeholder in DEFAULT_PLACEHOLDERS.items():
-                    csv_col_for_placeholder = self.column_mappings[key].get(); value_to_insert = ""
-                    if csv_col_for_placeholder and csv_col_for_placeholder != "Not Mapped" and csv_col_for_placeholder in row_data:
-                        value_to_insert = row_data[csv_col_for_placeholder]
-                    current_subject = current_subject.replace(placeholder, str(value_to_insert))
-                    current_body = current_body.replace(placeholder, str(value_to_insert))
+                current_subject = _render_compiled(subject_lits, subject_idxs, row_data) if subject_keys else subject_template
+                current_body = _render_compiled(body_lits, body_idxs, row_data) if body_keys else body_template
                 emails_to_send_list.append({'recipient_email': recipient_email, 'subject': current_subject, 'body': current_body, 'row_identifier': f"CSV Row {i+1}"})
             if not emails_to_send_list: messagebox.showinfo("Info", "No valid recipient emails found in CSV data."); return
 
@@ -683,8 +1087,9 @@ class BulkEmailerApp:
             if schedule_dt_obj and schedule_dt_obj <= datetime.datetime.now(): messagebox.showerror("Schedule Error", f"Scheduled time is in the past."); return
         
         if scheduled_campaign_data:
-             self._perform_email_sending(emails_to_send_list, is_test=False) 
+             self._perform_email_sending(emails_to_send_list, is_test=False)
              if campaign_id_to_send in self.scheduled_campaigns:
+                self._cancel_campaign_timer(campaign_id_to_send)
                 del self.scheduled_campaigns[campaign_id_to_send]; self.save_scheduled_campaigns_to_file()
              return
 
@@ -699,6 +1104,7 @@ class BulkEmailerApp:
                 "profile_name_at_schedule": self.active_profile_name.get()
             }
             self.save_scheduled_campaigns_to_file()
+            self._arm_campaign_timer(campaign_id)
             self.log_message(f"Campaign ID {campaign_id} scheduled for {schedule_dt_obj.strftime('%Y-%m-%d %H:%M')}.")
             messagebox.showinfo("Scheduled", f"Email campaign scheduled for {schedule_dt_obj.strftime('%Y-%m-%d %H:%M')}.\nApp must be running for automatic sending.")
         else: 
@@ -711,7 +1117,7 @@ class BulkEmailerApp:
         sender_email = self.smtp_email_var.get(); sender_password = self.smtp_password_var.get()
         if not sender_email or not sender_password: messagebox.showerror("Error", "Gmail address or App Password not set in active profile."); return
         if not self._is_valid_email(sender_email): messagebox.showerror("Error", "Invalid sender Gmail address format."); return
-        subject_template = self.email_subject_var.get(); body_template = self.email_body_text_widget.get("1.0", tk.END) if self.email_body_text_widget else ""
+        subject_template = self.email_subject_var.get(); body_template = self._get_body_template()
         if not subject_template or not body_template.strip(): messagebox.showerror("Error", "Email subject or body empty in active profile."); return
         cv_path = self.cv_file_path.get() 
         if cv_path and not os.path.exists(cv_path):
@@ -719,8 +1125,9 @@ class BulkEmailerApp:
             cv_path = None 
         elif cv_path and not cv_path.lower().endswith(".pdf"): messagebox.showerror("Error", "CV file must be a PDF."); return
         elif not cv_path: self.log_message("No CV selected in active profile for manual send.", error=False)
-        current_subject = subject_template.replace(DEFAULT_PLACEHOLDERS["FIRST_NAME"], first_name or "").replace(DEFAULT_PLACEHOLDERS["COMPANY_NAME"], company_name or "").replace(DEFAULT_PLACEHOLDERS["ROLE"], role or "").replace(DEFAULT_PLACEHOLDERS["LAST_NAME"], "") 
-        current_body = body_template.replace(DEFAULT_PLACEHOLDERS["FIRST_NAME"], first_name or "").replace(DEFAULT_PLACEHOLDERS["COMPANY_NAME"], company_name or "").replace(DEFAULT_PLACEHOLDERS["ROLE"], role or "").replace(DEFAULT_PLACEHOLDERS["LAST_NAME"], "")
+        manual_values = {"FIRST_NAME": first_name or "", "COMPANY_NAME": company_name or "", "ROLE": role or "", "LAST_NAME": ""}
+        current_subject = _render_template(subject_template, manual_values)
+        current_body = _render_template(body_template, manual_values)
         email_details = [{'recipient_email': recipient_email, 'subject': current_subject, 'body': current_body, 'row_identifier': "Manual Send"}]
         if not messagebox.askyesno("Confirm Manual Send", f"Send email to {recipient_email} now?"): return
         self._perform_email_sending(email_details, is_test=True) 
@@ -728,28 +1135,27 @@ class BulkEmailerApp:
     def send_test_email_process(self): 
         sender_email = self.smtp_email_var.get()
         if not sender_email or not self._is_valid_email(sender_email): messagebox.showerror("Error", "Your (sender) Gmail address is not set or invalid in active profile."); return
-        subject_template = self.email_subject_var.get(); body_template = self.email_body_text_widget.get("1.0", tk.END) if self.email_body_text_widget else ""
+        subject_template = self.email_subject_var.get(); body_template = self._get_body_template()
         if not subject_template or not body_template.strip(): messagebox.showerror("Error", "Email subject or body empty in active profile."); return
         test_fill_data = {}; active_tab_text = ""
         try: active_tab_text = self.notebook.tab(self.notebook.select(), "text")
         except tk.TclError: pass
-        if active_tab_text == "Manual Send" and (self.manual_first_name_var.get() or self.manual_company_name_var.get()): 
+        if active_tab_text == "Manual Send" and (self.manual_first_name_var.get() or self.manual_company_name_var.get()):
             self.log_message("Preparing test email using data from 'Manual Send' tab inputs.")
-            test_fill_data[DEFAULT_PLACEHOLDERS["FIRST_NAME"]] = self.manual_first_name_var.get() or "[TEST_FIRST_NAME]"; test_fill_data[DEFAULT_PLACEHOLDERS["LAST_NAME"]] = "" 
-            test_fill_data[DEFAULT_PLACEHOLDERS["COMPANY_NAME"]] = self.manual_company_name_var.get() or "[TEST_COMPANY]"; test_fill_data[DEFAULT_PLACEHOLDERS["ROLE"]] = self.manual_role_var.get() or "[TEST_ROLE]"
+            test_fill_data["FIRST_NAME"] = self.manual_first_name_var.get() or "[TEST_FIRST_NAME]"; test_fill_data["LAST_NAME"] = ""
+            test_fill_data["COMPANY_NAME"] = self.manual_company_name_var.get() or "[TEST_COMPANY]"; test_fill_data["ROLE"] = self.manual_role_var.get() or "[TEST_ROLE]"
         elif self.csv_data:
             self.log_message("Preparing test email using data from the first CSV row.")
             first_row = self.csv_data[0]
-            for key, placeholder in DEFAULT_PLACEHOLDERS.items():
+            for key in DEFAULT_PLACEHOLDERS:
                 csv_col_name = self.column_mappings[key].get()
-                if csv_col_name and csv_col_name != "Not Mapped" and csv_col_name in first_row: test_fill_data[placeholder] = first_row[csv_col_name]
-                else: test_fill_data[placeholder] = f"[{key.upper()}_TEST_DATA]"
+                if csv_col_name and csv_col_name != "Not Mapped" and csv_col_name in self._header_index: test_fill_data[key] = self._row_value(first_row, csv_col_name)
+                else: test_fill_data[key] = f"[{key.upper()}_TEST_DATA]"
         else:
             self.log_message("Preparing test email using generic placeholder data (no CSV/Manual data).")
-            for key, placeholder in DEFAULT_PLACEHOLDERS.items(): test_fill_data[placeholder] = f"[{key.upper()}_GENERIC_TEST]"
-        current_subject = subject_template; current_body = body_template
-        for placeholder, value in test_fill_data.items():
-            current_subject = current_subject.replace(placeholder, str(value)); current_body = current_body.replace(placeholder, str(value))
+            for key in DEFAULT_PLACEHOLDERS: test_fill_data[key] = f"[{key.upper()}_GENERIC_TEST]"
+        current_subject = _render_template(subject_template, test_fill_data)
+        current_body = _render_template(body_template, test_fill_data)
         email_details = [{'recipient_email': sender_email, 'subject': f"[TEST EMAIL] {current_subject}", 'body': current_body, 'row_identifier': "Test Email"}]
         if not messagebox.askyesno("Confirm Test Send", f"Send a test email to yourself ({sender_email})?"): return
         self._perform_email_sending(email_details, is_test=True)
@@ -805,12 +1211,11 @@ class BulkEmailerApp:
 
         def generate_from_template():
             if not use_template_var.get(): return
-            tpl_subject = self.email_subject_var.get(); tpl_body = self.email_body_text_widget.get("1.0", tk.END) if self.email_body_text_widget else ""
-            for key, ph_tk_var in ph_vars.items():
-                placeholder_text = DEFAULT_PLACEHOLDERS[key]
-                tpl_subject = tpl_subject.replace(placeholder_text, ph_tk_var.get() or "")
-                tpl_body = tpl_body.replace(placeholder_text, ph_tk_var.get() or "")
-            tpl_subject = tpl_subject.replace(DEFAULT_PLACEHOLDERS["LAST_NAME"], ""); tpl_body = tpl_body.replace(DEFAULT_PLACEHOLDERS["LAST_NAME"], "")
+            tpl_subject = self.email_subject_var.get(); tpl_body = self._get_body_template()
+            tpl_values = {key: (ph_tk_var.get() or "") for key, ph_tk_var in ph_vars.items()}
+            tpl_values["LAST_NAME"] = ""
+            tpl_subject = _render_template(tpl_subject, tpl_values)
+            tpl_body = _render_template(tpl_body, tpl_values)
             subject_var.set(tpl_subject); body_text_widget.delete("1.0", tk.END); body_text_widget.insert("1.0", tpl_body)
 
         def toggle_template_fields():
@@ -895,9 +1300,45 @@ class BulkEmailerApp:
             with open(SCHEDULED_CAMPAIGNS_FILE, "w") as f: json.dump(self.scheduled_campaigns, f, indent=4)
         except IOError as e: self.log_message(f"Error saving scheduled campaigns data: {e}", error=True)
 
-    def periodic_schedule_check(self):
-        self.check_for_pending_scheduled_jobs(silent=True)
-        self.root.after(60000, self.periodic_schedule_check) 
+    def _arm_pending_campaign_timers(self):
+        """Arm a one-shot root.after timer per future pending campaign, so the app
+        wakes exactly at the due time instead of polling every minute. Overdue
+        campaigns are handled by the startup check_for_pending_scheduled_jobs."""
+        now = datetime.datetime.now()
+        for campaign_id, campaign_data in list(self.scheduled_campaigns.items()):
+            if campaign_data.get("status") != "pending": continue
+            try: scheduled_dt = datetime.datetime.strptime(campaign_data["scheduled_datetime_str"], "%Y-%m-%d %H:%M:%S")
+            except ValueError: continue
+            if scheduled_dt > now: self._arm_campaign_timer(campaign_id)
+
+    def _arm_campaign_timer(self, campaign_id):
+        campaign_data = self.scheduled_campaigns.get(campaign_id)
+        if not campaign_data or campaign_data.get("status") != "pending": return
+        try: scheduled_dt = datetime.datetime.strptime(campaign_data["scheduled_datetime_str"], "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            self.log_message(f"Campaign {campaign_id} has invalid datetime string. Skipping.", error=True)
+            campaign_data["status"] = "error_invalid_date"; return
+        delay_ms = max(0, int((scheduled_dt - datetime.datetime.now()).total_seconds() * 1000))
+        self._cancel_campaign_timer(campaign_id)
+        if delay_ms > TIMER_MAX_DELAY_MS:
+            # Further out than one Tcl timer can wait: sleep the max and re-arm; the
+            # remaining delay is re-derived from the stored datetime on each hop.
+            self._schedule_after_ids[campaign_id] = self.root.after(TIMER_MAX_DELAY_MS, lambda: self._arm_campaign_timer(campaign_id))
+        else:
+            self._schedule_after_ids[campaign_id] = self.root.after(delay_ms, lambda: self._fire_campaign(campaign_id))
+
+    def _cancel_campaign_timer(self, campaign_id):
+        after_id = self._schedule_after_ids.pop(campaign_id, None)
+        if after_id is not None:
+            try: self.root.after_cancel(after_id)
+            except tk.TclError: pass
+
+    def _fire_campaign(self, campaign_id):
+        self._schedule_after_ids.pop(campaign_id, None)
+        campaign_data = self.scheduled_campaigns.get(campaign_id)
+        if not campaign_data or campaign_data.get("status") != "pending": return
+        self.log_message(f"Executing scheduled campaign: {campaign_id}")
+        self.send_emails_process(campaign_id_to_send=campaign_id, scheduled_campaign_data=campaign_data)
 
     def check_for_pending_scheduled_jobs(self, silent=False):
         now = datetime.datetime.now(); campaigns_to_send_now = {}
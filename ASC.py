@@ -8,12 +8,14 @@ from email.mime.base import MIMEBase
 from email import encoders
 import json
 import os
+import pickle
 import re # For email validation
 import datetime
 import time # For progress bar updates and basic scheduling
 import uuid # For unique campaign IDs
 
 CONFIG_FILE = "bulk_emailer_config_profiles.json"
+CONFIG_CACHE_FILE = CONFIG_FILE + ".pkl" # pickled (mtime, config) sidecar, skips json parsing on startup
 SCHEDULED_CAMPAIGNS_FILE = "scheduled_campaigns.json" # For persistent scheduled jobs
 
 DEFAULT_PLACEHOLDERS = {
@@ -32,6 +34,7 @@ AUTO_DETECT_PATTERNS = {
 }
 
 DEFAULT_PROFILE_NAME = "Default Profile"
+CSV_PREVIEW_ROWS = 1000 # rows kept in memory for preview/mapping; full files are streamed, not materialized
 
 class BulkEmailerApp:
     def __init__(self, root):
@@ -46,7 +49,8 @@ class BulkEmailerApp:
         self.csv_file_paths = []
         self.cv_file_path = tk.StringVar()
         self.csv_headers = []
-        self.csv_data = []
+        self.csv_data = [] # preview buffer only (first CSV_PREVIEW_ROWS rows); iterate _iter_csv_rows() for full passes
+        self.csv_row_count = 0
 
         self.email_column_var = tk.StringVar()
         self.column_mappings = {key: tk.StringVar() for key in DEFAULT_PLACEHOLDERS}
@@ -116,13 +120,32 @@ class BulkEmailerApp:
         app_config = {"active_profile_name": self.active_profile_name.get(), "profiles": self.profiles}
         try:
             with open(CONFIG_FILE, "w") as f: json.dump(app_config, f, indent=4)
+            self._write_config_cache(os.path.getmtime(CONFIG_FILE), app_config) # refresh cache so next launch skips json
             self.log_message("Application configuration (all profiles) saved.")
         except Exception as e: self.log_message(f"Error saving application configuration: {e}", error=True)
 
+    def _write_config_cache(self, mtime, app_config):
+        try:
+            tmp_path = CONFIG_CACHE_FILE + ".tmp"
+            with open(tmp_path, "wb") as f: pickle.dump((mtime, app_config), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, CONFIG_CACHE_FILE) # atomic, never leaves a half-written cache
+        except Exception: pass # cache is best-effort; the json file is still the source of truth
+
+    def _read_config_cache(self, mtime):
+        try:
+            with open(CONFIG_CACHE_FILE, "rb") as f: cached_mtime, app_config = pickle.load(f)
+            if cached_mtime == mtime: return app_config
+        except Exception: pass # missing/stale/corrupt cache -> fall back to json
+        return None
+
     def load_app_config(self):
         try:
             if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, "r") as f: app_config = json.load(f)
+                config_mtime = os.path.getmtime(CONFIG_FILE)
+                app_config = self._read_config_cache(config_mtime)
+                if app_config is None:
+                    with open(CONFIG_FILE, "r") as f: app_config = json.load(f)
+                    self._write_config_cache(config_mtime, app_config)
                 self.active_profile_name.set(app_config.get("active_profile_name", DEFAULT_PROFILE_NAME))
                 self.profiles = app_config.get("profiles", {})
                 if not self.profiles:
@@ -455,9 +478,23 @@ class BulkEmailerApp:
                 if not detected_placeholder and self.column_mappings[key].get() not in self.csv_headers: self.column_mappings[key].set("Not Mapped")
         self.update_column_mapping_dropdowns()
 
+    def _iter_csv_rows(self, file_paths=None, silent=True):
+        # Lazy row stream over the loaded CSVs - memory stays O(1 row) no matter the file size.
+        # Full-pass consumers (the send loop) should iterate this instead of csv_data.
+        for file_path in (file_paths if file_paths is not None else self.csv_file_paths):
+            try:
+                with open(file_path, mode='r', encoding='utf-8-sig', newline='') as file:
+                    reader = csv.DictReader(file)
+                    if not reader.fieldnames: continue
+                    for row in reader: yield row
+            except Exception as e:
+                if not silent: messagebox.showerror("CSV Error", f"Failed to load/parse {os.path.basename(file_path)}: {e}")
+                self.log_message(f"Failed to read {os.path.basename(file_path)}: {e}", error=True)
+
     def _load_csv_data_from_paths(self, file_paths, silent=False):
-        self.csv_data = []; combined_headers = set(); all_rows = []
+        self.csv_data = []; self.csv_row_count = 0; combined_headers = set(); preview_rows = []
         if not file_paths: self.csv_headers = []; self.csv_paths_label.config(text="No CSVs loaded."); self.update_column_mapping_dropdowns(); return True
+        total_rows = 0
         for file_path in file_paths:
             try:
                 with open(file_path, mode='r', encoding='utf-8-sig', newline='') as file:
@@ -465,16 +502,21 @@ class BulkEmailerApp:
                     if not reader.fieldnames:
                         if not silent: messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' is empty or has no headers. Skipping.")
                         continue
-                    current_file_rows = list(reader)
-                    if not current_file_rows and not silent: messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' has headers but no data rows.")
-                    all_rows.extend(current_file_rows)
+                    # Stream the file: count rows and keep only the first CSV_PREVIEW_ROWS
+                    # overall instead of materializing multi-GB recipient lists.
+                    file_rows = 0
+                    for row in reader:
+                        file_rows += 1
+                        if len(preview_rows) < CSV_PREVIEW_ROWS: preview_rows.append(row)
+                    if not file_rows and not silent: messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' has headers but no data rows.")
+                    total_rows += file_rows
                     for header in reader.fieldnames: combined_headers.add(header)
                 if not silent: self.log_message(f"Successfully processed {os.path.basename(file_path)}.")
             except Exception as e:
                 if not silent: messagebox.showerror("CSV Error", f"Failed to load/parse {os.path.basename(file_path)}: {e}"); self.log_message(f"Failed to load {os.path.basename(file_path)}: {e}", error=True)
-        self.csv_headers = sorted(list(combined_headers)); self.csv_data = all_rows
-        if not self.csv_data and not silent and file_paths: self.log_message("Warning: All loaded CSVs combined resulted in no data rows.", error=False)
-        elif self.csv_data: self.log_message(f"Total {len(self.csv_data)} rows loaded from {len(file_paths)} CSV file(s).")
+        self.csv_headers = sorted(list(combined_headers)); self.csv_data = preview_rows; self.csv_row_count = total_rows
+        if not total_rows and not silent and file_paths: self.log_message("Warning: All loaded CSVs combined resulted in no data rows.", error=False)
+        elif total_rows: self.log_message(f"Total {total_rows} rows loaded from {len(file_paths)} CSV file(s).")
         self.csv_paths_label.config(text=f"{len(file_paths)} CSV(s) loaded: " + ", ".join([os.path.basename(p) for p in file_paths]) if file_paths else "No CSVs loaded.")
         self._auto_detect_columns(); return True
 
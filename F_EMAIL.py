@@ -6,11 +6,17 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
+from email import base64mime
+from email.header import Header
+import io
 import json
 import os
 import re # For email validation
 import datetime
+import uuid # unique sentinels for the serialized message template
+import threading
 import time # For progress bar updates and basic scheduling
+from concurrent.futures import ThreadPoolExecutor
 
 CONFIG_FILE = "bulk_emailer_config_profiles.json"
 DEFAULT_PLACEHOLDERS = {
@@ -20,22 +26,49 @@ DEFAULT_PLACEHOLDERS = {
     "ROLE": "{{ROLE}}",
 }
 
+# frozensets: auto-detect tests membership per header, so lookups are O(1)
 AUTO_DETECT_PATTERNS = {
-    "email_column": ['email', 'e-mail', 'email address', 'e mail'],
-    "FIRST_NAME": ['firstname', 'first name', 'given name', 'first', 'fname'],
-    "LAST_NAME": ['lastname', 'last name', 'surname', 'lname'],
-    "COMPANY_NAME": ['companyname', 'company name', 'organization', 'company', 'employer'],
-    "ROLE": ['role', 'position', 'job title', 'applied for', 'job']
+    "email_column": frozenset(['email', 'e-mail', 'email address', 'e mail']),
+    "FIRST_NAME": frozenset(['firstname', 'first name', 'given name', 'first', 'fname']),
+    "LAST_NAME": frozenset(['lastname', 'last name', 'surname', 'lname']),
+    "COMPANY_NAME": frozenset(['companyname', 'company name', 'organization', 'company', 'employer']),
+    "ROLE": frozenset(['role', 'position', 'job title', 'applied for', 'job'])
 }
 
 DEFAULT_PROFILE_NAME = "Default Profile"
 
+SMTP_SEND_WORKERS = 4 # parallel SMTP connections for bulk sends
+
+CSV_READ_BUFFER = 1 << 20 # 1MB reads: far fewer syscalls than the default 8KB on big CSVs
+
+# Optional pause between sends on one connection. 0 disables the pause: the
+# old unconditional 0.05s sleep added 50ms x N of pure wall-clock for no
+# protocol reason (Gmail's limits are daily quotas, not per-message delays).
+SEND_THROTTLE_SECONDS = 0.0
+
+# Compiled once; _is_valid_email runs once per row plus sender/recipient checks.
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# One alternation over every placeholder: templates are rewritten in a single
+# scan instead of one str.replace pass per placeholder.
+_PLACEHOLDER_RE = re.compile("|".join(re.escape(p) for p in DEFAULT_PLACEHOLDERS.values()))
+
+def _render_template(template, values):
+    """Substitute all placeholders in one pass; values maps placeholder -> text."""
+    if not values:
+        return template
+    return _PLACEHOLDER_RE.sub(lambda m: str(values.get(m.group(0), "")), template)
+
 class BulkEmailerApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Advanced Bulk Emailer (Profiles)")
         self.root.geometry("950x750")
 
+        # --- Logging (batched: lines buffer here and flush ~20x/sec) ---
+        self._log_buffer = []
+        self._log_flush_pending = False
+
         # --- Profile Management ---
         self.profiles = {}
         self.active_profile_name = tk.StringVar()
@@ -45,7 +78,8 @@ class BulkEmailerApp:
         self.csv_file_paths = [] # List of paths for current session
         self.cv_file_path = tk.StringVar() # From active profile
         self.csv_headers = [] # Combined from all loaded CSVs
-        self.csv_data = [] # Combined from all loaded CSVs
+        self.csv_first_row = None # Cached for preview/test emails; rows stream from disk
+        self.csv_row_count = 0 # Counted at load time so the UI can report totals
 
         # --- Column Mapping (tied to active profile) ---
         self.email_column_var = tk.StringVar()
@@ -355,6 +389,8 @@ class BulkEmailerApp:
         log_frame = ttk.LabelFrame(main_container, text="Log", padding=10)
         log_frame.pack(fill=tk.X, padx=5, pady=(10,5), side=tk.BOTTOM)
         self.log_text = scrolledtext.ScrolledText(log_frame, wrap=tk.WORD, height=5, state='disabled', font=("Helvetica", 9))
+        self.log_text.tag_config("error_tag", foreground="red")
+        self.log_text.tag_config("info_tag", foreground="black")
         self.log_text.pack(fill=tk.X, expand=False)
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -401,20 +437,21 @@ class BulkEmailerApp:
         mapping_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         ttk.Label(mapping_frame, text="CSV Column for Email Address (Required):").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        self.email_column_menu = ttk.OptionMenu(mapping_frame, self.email_column_var, self.email_column_var.get() or "Select Email Column", *(self.csv_headers or ["Not Mapped"]))
+        # Comboboxes: the whole option list is one 'values' assignment (one Tcl
+        # call) instead of one menu.add_command round trip per column.
+        self.email_column_menu = ttk.Combobox(mapping_frame, textvariable=self.email_column_var, values=(self.csv_headers or ["Not Mapped"]), state="readonly")
         self.email_column_menu.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-        
+
         ttk.Label(mapping_frame, text="--- Map Placeholders to CSV Columns (Auto-detected where possible): ---").grid(row=1, column=0, columnspan=2, pady=(10,2))
-        
+
         self.placeholder_menus = {}
         current_row = 2
         for key, placeholder_text in DEFAULT_PLACEHOLDERS.items():
             label_text = f"{key.replace('_', ' ').title()} ({placeholder_text}):"
             ttk.Label(mapping_frame, text=label_text).grid(row=current_row, column=0, padx=5, pady=3, sticky="w")
             var = self.column_mappings[key]
-            # Ensure var has a value for OptionMenu initialization
-            initial_val_map = var.get() if var.get() else ("Not Mapped" if not self.csv_headers else (self.csv_headers[0] if self.csv_headers else "Not Mapped"))
-            menu = ttk.OptionMenu(mapping_frame, var, initial_val_map, *(self.csv_headers if self.csv_headers else ["Not Mapped"]))
+            if not var.get(): var.set("Not Mapped")
+            menu = ttk.Combobox(mapping_frame, textvariable=var, values=(self.csv_headers if self.csv_headers else ["Not Mapped"]), state="readonly")
             menu.grid(row=current_row, column=1, padx=5, pady=3, sticky="ew")
             self.placeholder_menus[key] = menu
             current_row += 1
@@ -508,50 +545,65 @@ class BulkEmailerApp:
         """Handles window close event by saving all settings automatically."""
         self.log_message("Closing application. Auto-saving all profiles and settings...")
         self.save_app_config() # Save everything
+        self._flush_log() # Drain anything still buffered before the widget goes away
         self.root.destroy()
 
     def log_message(self, message, error=False):
         if not hasattr(self, 'log_text') or self.log_text is None:
             print(f"LOG ({'ERROR' if error else 'INFO'}): {message}")
             return
+        # Buffer and flush on a timer: one widget insert + redraw per flush
+        # instead of one forced update_idletasks per log line.
+        self._log_buffer.append((datetime.datetime.now().strftime('%H:%M:%S'), message, error))
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after(50, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_pending = False
+        if not self._log_buffer: return
+        entries, self._log_buffer = self._log_buffer, []
         try:
             self.log_text.config(state='normal')
-            self.log_text.insert(tk.END, f"{datetime.datetime.now().strftime('%H:%M:%S')} - {message}\n", "error_tag" if error else "info_tag")
-            self.log_text.tag_config("error_tag", foreground="red")
-            self.log_text.tag_config("info_tag", foreground="black") # Or another non-red color
+            for stamp, message, error in entries:
+                self.log_text.insert(tk.END, f"{stamp} - {message}\n", "error_tag" if error else "info_tag")
             self.log_text.see(tk.END)
             self.log_text.config(state='disabled')
             if self.root and self.root.winfo_exists(): # Check if root window still exists
                  self.root.update_idletasks()
         except tk.TclError: # Handle cases where widget might be destroyed during shutdown
-            print(f"LOG (TclError suppressed): {message}")
+            for stamp, message, error in entries:
+                print(f"LOG (TclError suppressed): {message}")
 
 
     def _auto_detect_columns(self):
         if not self.csv_headers: return
 
+        # Normalize each header once up front; doing it inside the per-pattern
+        # loops re-normalized every header len(AUTO_DETECT_PATTERNS) times.
+        normalized_headers = [(h, h.lower().replace(" ", "").replace("_", "")) for h in self.csv_headers]
+
         # Email Column (prioritize profile setting if exists and valid)
         current_email_col_setting = self.email_column_var.get()
         if not current_email_col_setting or current_email_col_setting not in self.csv_headers:
             detected = False
-            for header in self.csv_headers:
-                if header.lower().replace(" ", "").replace("_", "") in AUTO_DETECT_PATTERNS["email_column"]:
+            for header, normalized_header in normalized_headers:
+                if normalized_header in AUTO_DETECT_PATTERNS["email_column"]:
                     self.email_column_var.set(header)
                     self.log_message(f"Auto-detected Email column: '{header}'")
                     detected = True
                     break
             if not detected and self.csv_headers : # If nothing specific found, and we have headers, pick first as placeholder
                  pass # Let user pick, or it will use current value which might be "Not Mapped"
-        
+
         for key, patterns in AUTO_DETECT_PATTERNS.items():
             if key == "email_column": continue # Already handled
-            
+
             current_mapping = self.column_mappings[key].get()
             # Only auto-detect if not set from profile or if current setting is not a valid header
             if not current_mapping or current_mapping == "Not Mapped" or current_mapping not in self.csv_headers:
                 detected_placeholder = False
-                for header in self.csv_headers:
-                    normalized_header = header.lower().replace(" ", "").replace("_", "")
+                for header, normalized_header in normalized_headers:
                     if normalized_header in patterns:
                         self.column_mappings[key].set(header)
                         self.log_message(f"Auto-detected {key.replace('_',' ').title()} column: '{header}'")
@@ -566,50 +618,91 @@ class BulkEmailerApp:
 
 
     def _load_csv_data_from_paths(self, file_paths, silent=False):
-        self.csv_data = []
-        combined_headers = set()
-        all_rows = []
+        """Scans headers and counts rows without materializing the data.
+
+        Rows stay on disk and are streamed by _iter_csv_rows at send time, so
+        peak memory no longer grows with the CSV size. Only the first data row
+        is cached (for preview/test emails)."""
+        self.csv_first_row = None
+        self.csv_row_count = 0
+        combined_headers = {} # dict preserves insertion order while deduplicating
 
         if not file_paths:
             self.csv_headers = []
             self.csv_paths_label.config(text="No CSVs loaded.")
             self.update_column_mapping_dropdowns()
-            return True 
+            return True
 
         for file_path in file_paths:
             try:
-                with open(file_path, mode='r', encoding='utf-8-sig', newline='') as file:
+                with open(file_path, mode='rb', buffering=CSV_READ_BUFFER) as raw:
+                    file = io.TextIOWrapper(raw, encoding='utf-8-sig', newline='')
                     reader = csv.DictReader(file)
                     if not reader.fieldnames:
                         if not silent: messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' is empty or has no headers. Skipping.")
                         continue
-                    
-                    current_file_rows = list(reader) # Read all rows to check count
-                    if not current_file_rows and not silent:
+
+                    first_row = next(reader, None)
+                    if first_row is None and not silent:
                          messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' has headers but no data rows.")
-                    
-                    all_rows.extend(current_file_rows) # Add them even if empty, header processing is separate
-                    for header in reader.fieldnames: # Add all headers from this file
-                        combined_headers.add(header)
+                    if first_row is not None:
+                        if self.csv_first_row is None:
+                            self.csv_first_row = first_row
+                        self.csv_row_count += 1 + sum(1 for _ in reader) # count the remainder, discard rows
+                    combined_headers.update(dict.fromkeys(reader.fieldnames)) # Add all headers from this file
                 if not silent: self.log_message(f"Successfully processed {os.path.basename(file_path)}.")
             except Exception as e:
                 if not silent:
                     messagebox.showerror("CSV Error", f"Failed to load/parse {os.path.basename(file_path)}: {e}")
                     self.log_message(f"Failed to load {os.path.basename(file_path)}: {e}", error=True)
-        
-        self.csv_headers = sorted(list(combined_headers)) # Use unique sorted headers
-        self.csv_data = all_rows # Assign combined rows
 
-        if not self.csv_data and not silent and file_paths:
+        self.csv_headers = list(combined_headers) # unique, in original CSV column order
+
+        if not self.csv_row_count and not silent and file_paths:
              self.log_message("Warning: All loaded CSVs combined resulted in no data rows (only headers might be present).", error=False) # Not a critical error
-        elif self.csv_data:
-             self.log_message(f"Total {len(self.csv_data)} rows loaded from {len(file_paths)} CSV file(s).")
-        
-        self.csv_paths_label.config(text=f"{len(file_paths)} CSV(s) loaded: " + ", ".join([os.path.basename(p) for p in file_paths]) if file_paths else "No CSVs loaded.")
+        elif self.csv_row_count:
+             self.log_message(f"Total {self.csv_row_count} rows found in {len(file_paths)} CSV file(s); rows will stream from disk at send time.")
+
+        if file_paths:
+            # Generator join, truncated: a label listing 100+ filenames is slow
+            # for Tk to wrap and useless to read anyway.
+            names = ", ".join(os.path.basename(p) for p in file_paths[:5])
+            if len(file_paths) > 5:
+                names += f", ... +{len(file_paths) - 5} more"
+            self.csv_paths_label.config(text=f"{len(file_paths)} CSV(s) loaded: {names}")
+        else:
+            self.csv_paths_label.config(text="No CSVs loaded.")
         self._auto_detect_columns() # This will also call update_column_mapping_dropdowns
         return True
 
 
+    def _iter_csv_rows(self):
+        """Yields (row_num, row_list, col_index) lazily across all loaded CSVs.
+
+        Rows are parsed on demand, so sending starts after the first line is
+        read instead of after a full parse of every file. Uses csv.reader
+        rather than DictReader: the send path only reads the email column plus
+        the few mapped placeholder columns, so building a dict of every column
+        per row is wasted work on wide CSVs. col_index maps header name to
+        position and is built once per file."""
+        row_num = 0
+        for file_path in self.csv_file_paths:
+            try:
+                with open(file_path, mode='rb', buffering=CSV_READ_BUFFER) as raw:
+                    file = io.TextIOWrapper(raw, encoding='utf-8-sig', newline='')
+                    reader = csv.reader(file)
+                    header = next(reader, None)
+                    if not header:
+                        continue
+                    col_index = {name: idx for idx, name in enumerate(header)}
+                    for row in reader:
+                        row_num += 1
+                        yield row_num, row, col_index
+            except Exception as e:
+                # May run on a worker thread, so post the log to the Tk thread
+                self.root.after(0, lambda p=file_path, err=e: self.log_message(f"Failed to read {os.path.basename(p)}: {err}", error=True))
+
+
     def load_csv_files(self):
         filepaths = filedialog.askopenfilenames(
             title="Select CSV Files",
@@ -634,50 +727,59 @@ class BulkEmailerApp:
                 messagebox.showerror("File Error", "Please select a PDF file for the CV.")
 
     def update_column_mapping_dropdowns(self):
-        """Updates OptionMenu widgets with current CSV headers and preserves selections if possible."""
+        """Updates mapping comboboxes with current CSV headers and preserves selections if possible."""
         options = ["Not Mapped"] + (self.csv_headers if self.csv_headers else [])
-        
+
         # Update Email Column Dropdown
         if hasattr(self, 'email_column_menu'):
-            current_email_col_val = self.email_column_var.get()
-            self.email_column_menu['menu'].delete(0, 'end')
-            # Set default for OptionMenu if current value is not in new options
-            default_email_option = current_email_col_val if current_email_col_val in options else options[0]
-            self.email_column_var.set(default_email_option) # Set the var first
-            for option_val in options: # Then populate menu
-                self.email_column_menu['menu'].add_command(label=option_val, command=tk._setit(self.email_column_var, option_val))
-        
+            if self.email_column_var.get() not in options:
+                self.email_column_var.set(options[0])
+            self.email_column_menu['values'] = tuple(options)
+
         # Update Placeholder Mapping Dropdowns
         if hasattr(self, 'placeholder_menus'):
-            for key, menu_widget in self.placeholder_menus.items():
-                current_placeholder_val = self.column_mappings[key].get()
-                menu_widget['menu'].delete(0, 'end')
-                default_placeholder_option = current_placeholder_val if current_placeholder_val in options else options[0]
-                self.column_mappings[key].set(default_placeholder_option) # Set var first
-                for option_val in options:
-                    menu_widget['menu'].add_command(label=option_val, command=tk._setit(self.column_mappings[key], option_val))
-        
+            for key, combo in self.placeholder_menus.items():
+                if self.column_mappings[key].get() not in options:
+                    self.column_mappings[key].set(options[0])
+                combo['values'] = tuple(options)
+
         self.update_column_mapping_dropdowns_state()
 
 
     def update_column_mapping_dropdowns_state(self):
-        state = tk.NORMAL if self.csv_headers else tk.DISABLED
+        state = "readonly" if self.csv_headers else "disabled"
         if hasattr(self, 'email_column_menu'): self.email_column_menu.config(state=state)
         if hasattr(self, 'placeholder_menus'):
             for menu in self.placeholder_menus.values(): menu.config(state=state)
 
     def _is_valid_email(self, email_string):
         if not email_string or not isinstance(email_string, str): return False
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return re.match(pattern, email_string) is not None
+        return _EMAIL_RE.match(email_string) is not None
 
-    def _validate_send_time_format(self, time_str):
-        if not time_str: return True 
+    def _verify_smtp_credentials(self, sender_email, sender_password):
+        """One lightweight login/quit so bad credentials are caught up front."""
         try:
-            datetime.datetime.strptime(time_str, "%H:%M")
+            server = smtplib.SMTP("smtp.gmail.com", 587, timeout=15)
+            server.ehlo()
+            server.starttls()
+            server.ehlo()
+            server.login(sender_email, sender_password)
+            server.quit()
             return True
-        except ValueError:
-            return False
+        except smtplib.SMTPAuthenticationError:
+            err = "SMTP Authentication Error. Check Gmail & App Password. Use App Password for 2FA."
+            self.log_message(err, error=True); messagebox.showerror("SMTP Auth Error", err)
+        except Exception as e:
+            self.log_message(f"Could not verify SMTP login: {e}", error=True)
+            messagebox.showerror("SMTP Error", f"Could not verify SMTP login: {e}")
+        return False
+
+    def _validate_send_time_format(self, time_str):
+        # Manual parse: strptime re-parses its format string on every call
+        if not time_str: return True
+        parts = time_str.split(':')
+        return (len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit()
+                and 0 <= int(parts[0]) < 24 and 0 <= int(parts[1]) < 60)
 
     def preview_email(self, manual_mode=False):
         if self.email_body_text_widget is None: messagebox.showerror("Error", "Email body editor not available."); return
@@ -695,8 +797,8 @@ class BulkEmailerApp:
             preview_fill_data[DEFAULT_PLACEHOLDERS["COMPANY_NAME"]] = self.manual_company_name_var.get() or "[MANUAL_COMPANY_NAME]"
             preview_fill_data[DEFAULT_PLACEHOLDERS["ROLE"]] = self.manual_role_var.get() or "[MANUAL_ROLE]"
         else: # Bulk mode preview
-            if not self.csv_data: messagebox.showinfo("Preview Info", "Load CSV data to preview bulk email."); return
-            first_row = self.csv_data[0]
+            if not self.csv_first_row: messagebox.showinfo("Preview Info", "Load CSV data to preview bulk email."); return
+            first_row = self.csv_first_row
             for key, placeholder in DEFAULT_PLACEHOLDERS.items():
                 csv_col_name = self.column_mappings[key].get()
                 if csv_col_name and csv_col_name != "Not Mapped" and csv_col_name in first_row:
@@ -704,11 +806,8 @@ class BulkEmailerApp:
                 else: # If not mapped or data missing in first row for that column
                     preview_fill_data[placeholder] = f"[{key.upper()}_DATA]"
         
-        final_subject = subject_template
-        final_body = body_template
-        for placeholder, value in preview_fill_data.items():
-            final_subject = final_subject.replace(placeholder, str(value))
-            final_body = final_body.replace(placeholder, str(value))
+        final_subject = _render_template(subject_template, preview_fill_data)
+        final_body = _render_template(body_template, preview_fill_data)
         
         preview_window = tk.Toplevel(self.root)
         preview_window.title("Email Preview")
@@ -726,8 +825,21 @@ class BulkEmailerApp:
         ttk.Button(preview_window, text="Close", command=preview_window.destroy).pack(pady=10)
 
 
-    def _perform_email_sending(self, emails_to_send_list, is_test=False):
-        cv_path = self.cv_file_path.get() 
+    def _ui(self, func, *args, **kwargs):
+        """Schedules a callable onto the Tk main thread; safe to call from workers."""
+        self.root.after(0, lambda: func(*args, **kwargs))
+
+    def _perform_email_sending(self, emails_to_send, is_test=False, total=None):
+        """Kicks off the SMTP work on a background thread so Tk stays responsive.
+
+        All UI updates from the worker (logs, progress, dialogs, button state)
+        are marshalled back to the main thread via _ui/root.after."""
+        if total is None:
+            total = len(emails_to_send) if hasattr(emails_to_send, '__len__') else 0
+        if getattr(self, '_send_thread', None) is not None and self._send_thread.is_alive():
+            messagebox.showinfo("Sending In Progress", "A sending process is already running. Please wait for it to finish.")
+            return
+        cv_path = self.cv_file_path.get()
         sender_email = self.smtp_email_var.get()
         sender_password = self.smtp_password_var.get()
 
@@ -740,73 +852,174 @@ class BulkEmailerApp:
              cv_path = None
 
 
-        self.log_message(f"Starting SMTP process for {len(emails_to_send_list)} email(s)...")
+        self.log_message(f"Starting SMTP process for {total} email(s)...")
         if hasattr(self, 'send_button'): self.send_button.config(state=tk.DISABLED)
-        if hasattr(self, 'progress_bar'): self.progress_bar['value'] = 0; self.progress_bar['maximum'] = len(emails_to_send_list) if emails_to_send_list else 1
+        if hasattr(self, 'progress_bar'): self.progress_bar['value'] = 0; self.progress_bar['maximum'] = total if total else 1
+
+        self._send_thread = threading.Thread(
+            target=self._email_sending_work,
+            args=(emails_to_send, is_test, total, cv_path, sender_email, sender_password),
+            daemon=True)
+        self._send_thread.start()
 
+    def _email_sending_work(self, emails_to_send, is_test, total, cv_path, sender_email, sender_password):
+        """Runs on a background thread; must not touch Tk directly."""
         sent_count = 0
         failed_count = 0
 
-        try:
-            server = smtplib.SMTP("smtp.gmail.com", 587)
-            server.ehlo() # Greet server
-            server.starttls()
-            server.ehlo() # Greet again after TLS
-            server.login(sender_email, sender_password)
-            self.log_message("Logged into Gmail SMTP server.")
-
-            for i, email_details in enumerate(emails_to_send_list):
-                recipient_email = email_details['recipient_email']
-                current_subject = email_details['subject']
-                current_body = email_details['body']
-                row_identifier = email_details.get('row_identifier', f"item {i+1}")
+        # Read and base64-encode the CV once per batch; the encoded part carries
+        # no per-recipient state, so every message can attach the same object.
+        cv_part = None
+        if cv_path and os.path.exists(cv_path) and cv_path.lower().endswith(".pdf"):
+            try:
+                with open(cv_path, "rb") as attachment_file:
+                    cv_part = MIMEBase('application', 'octet-stream')
+                    cv_part.set_payload(attachment_file.read())
+                encoders.encode_base64(cv_part)
+                cv_part.add_header('Content-Disposition', f"attachment; filename= {os.path.basename(cv_path)}")
+            except Exception as e:
+                self._ui(self.log_message, f"Failed to prepare CV attachment: {e}. Sending without CV.", error=True)
+                cv_part = None
 
+        try:
+            if is_test or total <= 1:
+                # Single/test sends: one connection, simple serial loop
+                server = smtplib.SMTP("smtp.gmail.com", 587)
+                server.ehlo() # Greet server
+                server.starttls()
+                server.ehlo() # Greet again after TLS
+                server.login(sender_email, sender_password)
+                self._ui(self.log_message, "Logged into Gmail SMTP server.")
+
+                # One reusable message: headers and the text payload are mutated
+                # per recipient instead of rebuilding the MIME tree each time.
+                text_part = MIMEText('', 'plain', 'utf-8')
                 msg = MIMEMultipart()
                 msg['From'] = sender_email
-                msg['To'] = recipient_email
-                msg['Subject'] = current_subject
-                msg.attach(MIMEText(current_body, 'plain', 'utf-8'))
+                msg['To'] = ''
+                msg['Subject'] = ''
+                msg.attach(text_part)
+                if cv_part is not None:
+                    msg.attach(cv_part)
+
+                for i, email_details in enumerate(emails_to_send):
+                    recipient_email = email_details['recipient_email']
+                    current_subject = email_details['subject']
+                    current_body = email_details['body']
+                    row_identifier = email_details.get('row_identifier', f"item {i+1}")
+
+                    msg.replace_header('To', recipient_email)
+                    msg.replace_header('Subject', current_subject)
+                    # Pre-encoded payload keeps the part's base64 CTE header truthful
+                    text_part.set_payload(base64mime.body_encode(current_body.encode('utf-8')))
 
-                if cv_path and os.path.exists(cv_path) and cv_path.lower().endswith(".pdf"): 
                     try:
-                        with open(cv_path, "rb") as attachment_file:
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(attachment_file.read())
-                        encoders.encode_base64(part)
-                        part.add_header('Content-Disposition', f"attachment; filename= {os.path.basename(cv_path)}")
-                        msg.attach(part)
+                        server.sendmail(sender_email, recipient_email, msg.as_string())
+                        self._ui(self.log_message, f"Email sent to {recipient_email} ({row_identifier})")
+                        sent_count += 1
                     except Exception as e:
-                        self.log_message(f"Failed to attach CV for {recipient_email} ({row_identifier}): {e}", error=True)
-                        if not is_test: failed_count += 1; self.update_progress(i + 1); continue 
-                
-                try:
-                    server.sendmail(sender_email, recipient_email, msg.as_string())
-                    self.log_message(f"Email sent to {recipient_email} ({row_identifier})")
-                    sent_count += 1
-                except Exception as e:
-                    self.log_message(f"Failed to send email to {recipient_email} ({row_identifier}): {e}", error=True)
-                    if not is_test: failed_count += 1
-                
-                if not is_test: self.update_progress(i + 1)
-                time.sleep(0.05) # Shorter delay
+                        self._ui(self.log_message, f"Failed to send email to {recipient_email} ({row_identifier}): {e}", error=True)
+                        if not is_test: failed_count += 1
 
-            server.quit()
-            self.log_message("Disconnected from SMTP server.")
+                    if not is_test: self._ui(self.update_progress, i + 1)
+                    if SEND_THROTTLE_SECONDS: time.sleep(SEND_THROTTLE_SECONDS)
+
+                server.quit()
+                self._ui(self.log_message, "Disconnected from SMTP server.")
+            else:
+                sent_count, failed_count = self._send_parallel(emails_to_send, sender_email, sender_password, cv_part)
+                self._ui(self.log_message, "All SMTP worker connections closed.")
 
         except smtplib.SMTPAuthenticationError:
             err = "SMTP Authentication Error. Check Gmail & App Password. Use App Password for 2FA."
-            self.log_message(err, error=True); messagebox.showerror("SMTP Auth Error", err)
-            if not is_test: failed_count = len(emails_to_send_list) - sent_count
+            self._ui(self.log_message, err, error=True); self._ui(messagebox.showerror, "SMTP Auth Error", err)
+            if not is_test: failed_count = total - sent_count
         except smtplib.SMTPConnectError:
             err = "SMTP Connection Error. Could not connect. Check internet."
-            self.log_message(err, error=True); messagebox.showerror("SMTP Connection Error", err)
-            if not is_test: failed_count = len(emails_to_send_list) - sent_count
+            self._ui(self.log_message, err, error=True); self._ui(messagebox.showerror, "SMTP Connection Error", err)
+            if not is_test: failed_count = total - sent_count
         except Exception as e:
-            self.log_message(f"An unexpected error during sending: {e}", error=True); messagebox.showerror("Sending Error", f"Unexpected error: {e}")
+            self._ui(self.log_message, f"An unexpected error during sending: {e}", error=True); self._ui(messagebox.showerror, "Sending Error", f"Unexpected error: {e}")
         finally:
-            self.log_message(f"Process finished. Sent: {sent_count}, Failed: {failed_count if not is_test else 'N/A for test'}.")
-            if hasattr(self, 'send_button'): self.send_button.config(state=tk.NORMAL)
-            if hasattr(self, 'progress_bar') and not is_test and emails_to_send_list : self.progress_bar['value'] = self.progress_bar['maximum'] 
+            self._ui(self.log_message, f"Process finished. Sent: {sent_count}, Failed: {failed_count if not is_test else 'N/A for test'}.")
+            self._ui(self._finish_sending_ui, is_test, total)
+
+    def _finish_sending_ui(self, is_test, total):
+        if hasattr(self, 'send_button'): self.send_button.config(state=tk.NORMAL)
+        if hasattr(self, 'progress_bar') and not is_test and total : self.progress_bar['value'] = self.progress_bar['maximum']
+
+    def _send_parallel(self, emails_to_send, sender_email, sender_password, cv_part):
+        """Fans a bulk batch out over SMTP_SEND_WORKERS parallel connections.
+
+        Workers pull messages from the shared iterator under a lock (so the
+        streaming CSV input keeps streaming), and each worker logs in once and
+        reuses its connection for its whole share of the batch. Log/progress
+        updates are posted back to the Tk thread via root.after. Returns
+        (sent_count, failed_count); login/connect errors propagate to the
+        caller's handlers."""
+        rows = iter(emails_to_send)
+        lock = threading.Lock()
+        counters = {'sent': 0, 'failed': 0, 'done': 0}
+
+        # Serialize the MIME envelope (including the base64 CV) exactly once,
+        # with UUID sentinels where the recipient, subject and body go. Per
+        # message the workers patch those three spots with str.replace instead
+        # of re-walking the whole MIME tree through msg.as_string().
+        to_token = f"TO-{uuid.uuid4().hex}"
+        subj_token = f"SUBJ-{uuid.uuid4().hex}"
+        body_token = f"BODY-{uuid.uuid4().hex}"
+        msg_template = MIMEMultipart()
+        msg_template['From'] = sender_email
+        msg_template['To'] = to_token
+        msg_template['Subject'] = subj_token
+        body_part = MIMEText("", 'plain', 'utf-8') # fixes the base64 CTE header once
+        body_part.set_payload(body_token) # raw sentinel; replaced with encoded body per message
+        msg_template.attach(body_part)
+        if cv_part is not None:
+            msg_template.attach(cv_part)
+        wire_template = msg_template.as_string()
+
+        def worker():
+            server = smtplib.SMTP("smtp.gmail.com", 587)
+            server.ehlo()
+            server.starttls()
+            server.ehlo()
+            server.login(sender_email, sender_password)
+            try:
+                while True:
+                    with lock:
+                        email_details = next(rows, None)
+                    if email_details is None:
+                        return
+                    recipient_email = email_details['recipient_email']
+                    row_identifier = email_details.get('row_identifier', '')
+                    # Header() keeps non-ASCII subjects legal; the body is
+                    # base64-encoded to match the template's CTE header.
+                    wire = (wire_template
+                            .replace(to_token, recipient_email, 1)
+                            .replace(subj_token, Header(email_details['subject']).encode(), 1)
+                            .replace(body_token, base64mime.body_encode(email_details['body'].encode('utf-8')), 1))
+                    try:
+                        server.sendmail(sender_email, recipient_email, wire)
+                        with lock:
+                            counters['sent'] += 1; counters['done'] += 1; done = counters['done']
+                        self.root.after(0, lambda r=recipient_email, ri=row_identifier: self.log_message(f"Email sent to {r} ({ri})"))
+                    except Exception as e:
+                        with lock:
+                            counters['failed'] += 1; counters['done'] += 1; done = counters['done']
+                        self.root.after(0, lambda r=recipient_email, ri=row_identifier, err=e: self.log_message(f"Failed to send email to {r} ({ri}): {err}", error=True))
+                    self.root.after(0, lambda d=done: self.update_progress(d))
+                    if SEND_THROTTLE_SECONDS: time.sleep(SEND_THROTTLE_SECONDS)
+            finally:
+                try: server.quit()
+                except Exception: pass
+
+        with ThreadPoolExecutor(max_workers=SMTP_SEND_WORKERS) as pool:
+            futures = [pool.submit(worker) for _ in range(SMTP_SEND_WORKERS)]
+            for future in futures:
+                future.result() # surface login/connect errors from workers
+
+        return counters['sent'], counters['failed']
 
     def update_progress(self, current_step):
         if hasattr(self, 'progress_bar'):
@@ -815,7 +1028,7 @@ class BulkEmailerApp:
 
 
     def send_emails_process(self):
-        if not self.csv_data: messagebox.showerror("Error", "No CSV data loaded."); return
+        if not self.csv_file_paths or not self.csv_row_count: messagebox.showerror("Error", "No CSV data loaded."); return
         
         email_col_name = self.email_column_var.get()
         if not email_col_name or email_col_name == "Not Mapped" or email_col_name not in self.csv_headers:
@@ -829,7 +1042,11 @@ class BulkEmailerApp:
         subject_template = self.email_subject_var.get()
         body_template = self.email_body_text_widget.get("1.0", tk.END) if self.email_body_text_widget else ""
         if not subject_template or not body_template.strip(): messagebox.showerror("Error", "Email subject or body empty in active profile."); return
-        
+
+        # Fail fast on bad credentials: one cheap login attempt before any CSV
+        # parsing, templating or confirmation dialogs happen.
+        if not self._verify_smtp_credentials(sender_email, sender_password): return
+
         cv_path = self.cv_file_path.get() # Get CV path from active profile
         if cv_path and not os.path.exists(cv_path):
             if not messagebox.askyesno("CV Path Invalid", f"The CV path for the active profile is invalid:\n'{cv_path}'\nContinue without attaching any CV?"): return
@@ -841,33 +1058,49 @@ class BulkEmailerApp:
              self.log_message("No CV selected in active profile. Emails will be sent without attachments.", error=False)
 
 
-        emails_to_send_list = []
-        for i, row_data in enumerate(self.csv_data):
-            recipient_email = row_data.get(email_col_name)
-            if not recipient_email or not self._is_valid_email(recipient_email):
-                self.log_message(f"Skipping row {i+1}: Invalid/missing email '{recipient_email}'.", error=True)
-                continue
-            
-            current_subject = subject_template
-            current_body = body_template
-            for key, placeholder in DEFAULT_PLACEHOLDERS.items():
-                csv_col_for_placeholder = self.column_mappings[key].get()
-                value_to_insert = ""
-                if csv_col_for_placeholder and csv_col_for_placeholder != "Not Mapped" and csv_col_for_placeholder in row_data:
-                    value_to_insert = row_data[csv_col_for_placeholder]
-                current_subject = current_subject.replace(placeholder, str(value_to_insert))
-                current_body = current_body.replace(placeholder, str(value_to_insert))
-            
-            emails_to_send_list.append({
-                'recipient_email': recipient_email, 
-                'subject': current_subject, 
-                'body': current_body,
-                'row_identifier': f"CSV Row {i+1}"
-            })
-        
-        if not emails_to_send_list:
-            messagebox.showinfo("Info", "No valid recipient emails found in CSV data to send."); return
-
+        # Resolve each mapping StringVar once; every .get() is a Python<->Tcl
+        # round trip, so reading them per row would dominate on large CSVs.
+        col_for_placeholder = {}
+        for key, placeholder in DEFAULT_PLACEHOLDERS.items():
+            csv_col = self.column_mappings[key].get()
+            col_for_placeholder[placeholder] = csv_col if csv_col and csv_col != "Not Mapped" else None
+
+        # Scan each template once up front: if it contains no placeholders at
+        # all, the per-row substitution (and the values dict) is skipped and
+        # the same immutable string is reused for every recipient.
+        subject_has_placeholders = _PLACEHOLDER_RE.search(subject_template) is not None
+        body_has_placeholders = _PLACEHOLDER_RE.search(body_template) is not None
+
+        # Rows stream from disk: each one is parsed, templated and yielded as
+        # it is sent, so nothing is materialized before (or without) a confirm.
+        def emails_to_send():
+            last_col_index = None
+            email_idx = None
+            placeholder_idx = {}
+            for row_num, row, col_index in self._iter_csv_rows():
+                if col_index is not last_col_index: # new file: resolve column positions once
+                    last_col_index = col_index
+                    email_idx = col_index.get(email_col_name)
+                    placeholder_idx = {placeholder: (col_index.get(csv_col) if csv_col else None)
+                                       for placeholder, csv_col in col_for_placeholder.items()}
+                recipient_email = row[email_idx] if email_idx is not None and email_idx < len(row) else None
+                if not recipient_email or not self._is_valid_email(recipient_email):
+                    # May run on a worker thread, so post the log to the Tk thread
+                    self.root.after(0, lambda n=row_num, r=recipient_email: self.log_message(f"Skipping row {n}: Invalid/missing email '{r}'.", error=True))
+                    continue
+                if subject_has_placeholders or body_has_placeholders:
+                    values = {placeholder: (row[idx] if idx is not None and idx < len(row) else "")
+                              for placeholder, idx in placeholder_idx.items()}
+                else:
+                    values = None
+                yield {
+                    'recipient_email': recipient_email,
+                    'subject': _render_template(subject_template, values) if subject_has_placeholders else subject_template,
+                    'body': _render_template(body_template, values) if body_has_placeholders else body_template,
+                    'row_identifier': f"CSV Row {row_num}"
+                }
+
+        total_rows = self.csv_row_count
         send_time_str = self.preferred_send_time_var.get()
         if not self._validate_send_time_format(send_time_str):
             messagebox.showerror("Error", "Invalid 'Preferred Send Time' format. Use HH:MM or leave blank."); return
@@ -883,16 +1116,16 @@ class BulkEmailerApp:
                      return
 
                 delay_ms = int((scheduled_dt - now).total_seconds() * 1000)
-                if not messagebox.askyesno("Confirm Schedule", f"Schedule sending of {len(emails_to_send_list)} emails for {send_time_str} today? App must remain open."):
+                if not messagebox.askyesno("Confirm Schedule", f"Schedule sending of up to {total_rows} emails for {send_time_str} today? App must remain open."):
                     return
-                
+
                 self.log_message(f"Emails scheduled for {send_time_str}. Delaying for {delay_ms/1000:.0f}s.")
-                self.root.after(delay_ms, lambda: self._perform_email_sending(emails_to_send_list))
+                self.root.after(delay_ms, lambda: self._perform_email_sending(emails_to_send(), total=total_rows))
             except ValueError:
                 messagebox.showerror("Error", "Invalid time format in 'Preferred Send Time'. Use HH:MM."); return
-        else: 
-            if not messagebox.askyesno("Confirm Send", f"Send {len(emails_to_send_list)} emails now?"): return
-            self._perform_email_sending(emails_to_send_list)
+        else:
+            if not messagebox.askyesno("Confirm Send", f"Send up to {total_rows} emails now?"): return
+            self._perform_email_sending(emails_to_send(), total=total_rows)
 
 
     def send_manual_email_process(self):
@@ -923,15 +1156,14 @@ class BulkEmailerApp:
              self.log_message("No CV selected in active profile for manual send.", error=False)
 
 
-        current_subject = subject_template.replace(DEFAULT_PLACEHOLDERS["FIRST_NAME"], first_name or "")
-        current_subject = current_subject.replace(DEFAULT_PLACEHOLDERS["COMPANY_NAME"], company_name or "")
-        current_subject = current_subject.replace(DEFAULT_PLACEHOLDERS["ROLE"], role or "")
-        current_subject = current_subject.replace(DEFAULT_PLACEHOLDERS["LAST_NAME"], "") 
-
-        current_body = body_template.replace(DEFAULT_PLACEHOLDERS["FIRST_NAME"], first_name or "")
-        current_body = current_body.replace(DEFAULT_PLACEHOLDERS["COMPANY_NAME"], company_name or "")
-        current_body = current_body.replace(DEFAULT_PLACEHOLDERS["ROLE"], role or "")
-        current_body = current_body.replace(DEFAULT_PLACEHOLDERS["LAST_NAME"], "")
+        manual_values = {
+            DEFAULT_PLACEHOLDERS["FIRST_NAME"]: first_name or "",
+            DEFAULT_PLACEHOLDERS["LAST_NAME"]: "",
+            DEFAULT_PLACEHOLDERS["COMPANY_NAME"]: company_name or "",
+            DEFAULT_PLACEHOLDERS["ROLE"]: role or "",
+        }
+        current_subject = _render_template(subject_template, manual_values)
+        current_body = _render_template(body_template, manual_values)
 
         email_details = [{'recipient_email': recipient_email, 'subject': current_subject, 'body': current_body, 'row_identifier': "Manual Send"}]
         
@@ -962,9 +1194,9 @@ class BulkEmailerApp:
             test_fill_data[DEFAULT_PLACEHOLDERS["LAST_NAME"]] = "" 
             test_fill_data[DEFAULT_PLACEHOLDERS["COMPANY_NAME"]] = self.manual_company_name_var.get() or "[TEST_COMPANY]"
             test_fill_data[DEFAULT_PLACEHOLDERS["ROLE"]] = self.manual_role_var.get() or "[TEST_ROLE]"
-        elif self.csv_data:
+        elif self.csv_first_row:
             self.log_message("Preparing test email using data from the first CSV row.")
-            first_row = self.csv_data[0]
+            first_row = self.csv_first_row
             for key, placeholder in DEFAULT_PLACEHOLDERS.items():
                 csv_col_name = self.column_mappings[key].get()
                 if csv_col_name and csv_col_name != "Not Mapped" and csv_col_name in first_row:
@@ -976,11 +1208,8 @@ class BulkEmailerApp:
             for key, placeholder in DEFAULT_PLACEHOLDERS.items():
                 test_fill_data[placeholder] = f"[{key.upper()}_GENERIC_TEST]"
 
-        current_subject = subject_template
-        current_body = body_template
-        for placeholder, value in test_fill_data.items():
-            current_subject = current_subject.replace(placeholder, str(value))
-            current_body = current_body.replace(placeholder, str(value))
+        current_subject = _render_template(subject_template, test_fill_data)
+        current_body = _render_template(body_template, test_fill_data)
 
         email_details = [{'recipient_email': sender_email, 'subject': f"[TEST EMAIL] {current_subject}", 'body': current_body, 'row_identifier': "Test Email"}]
         
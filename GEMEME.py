@@ -1,18 +1,25 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
 import csv
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+# smtplib and the email.* machinery are imported lazily at send time; they cost
+# a noticeable chunk of cold-start and CSV-only sessions never need them.
+import base64
+import copy
 import json
 import os
 import re # For email validation
 import datetime
 import time # For progress bar updates and basic scheduling
+import threading
+import queue
+
+try:
+    import pyarrow.csv as pacsv # Optional: C-accelerated CSV parsing for large files
+except ImportError:
+    pacsv = None
 
 CONFIG_FILE = "bulk_emailer_config_profiles.json"
+SMTP_MAX_CONNECTIONS = 15 # Gmail tolerates roughly this many simultaneous SMTP sessions
 DEFAULT_PLACEHOLDERS = {
     "FIRST_NAME": "{{FIRST_NAME}}",
     "LAST_NAME": "{{LAST_NAME}}",
@@ -30,6 +37,20 @@ AUTO_DETECT_PATTERNS = {
 
 DEFAULT_PROFILE_NAME = "Default Profile"
 
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# One compiled alternation over all placeholder tokens lets a template be
+# rendered in a single C-level scan instead of one str.replace pass per token.
+# Same one-pass mechanism as string.Template.safe_substitute, but it works on
+# the {{...}} tokens users already have saved in their profiles.
+_PLACEHOLDER_RE = re.compile("|".join(re.escape(p) for p in DEFAULT_PLACEHOLDERS.values()))
+_PLACEHOLDER_ITEMS = tuple(DEFAULT_PLACEHOLDERS.items()) # Snapshotted once for the hot loops
+_substitute = _PLACEHOLDER_RE.sub
+
+def _render_template(template, mapping):
+    """Substitute all {{...}} placeholders in one pass; mapping is keyed by placeholder text."""
+    return _substitute(lambda m: str(mapping.get(m.group(0), "")), template)
+
 class BulkEmailerApp:
     def __init__(self, root):
         self.root = root
@@ -45,7 +66,8 @@ class BulkEmailerApp:
         self.csv_file_paths = [] # List of paths for current session
         self.cv_file_path = tk.StringVar() # From active profile
         self.csv_headers = [] # Combined from all loaded CSVs
-        self.csv_data = [] # Combined from all loaded CSVs
+        self.csv_columns = {} # Combined from all loaded CSVs, stored column-wise (header -> list of values)
+        self.csv_row_count = 0
 
         # --- Column Mapping (tied to active profile) ---
         self.email_column_var = tk.StringVar()
@@ -61,6 +83,11 @@ class BulkEmailerApp:
 
         # --- Scheduling (tied to active profile) ---
         self.preferred_send_time_var = tk.StringVar() # HH:MM format
+        self._scheduled_timer = None # Pending threading.Timer for a scheduled bulk send
+        self._last_progress_step = 0 # Progress-bar flush throttling
+        self._last_progress_ts = 0.0
+        self._smtp = None # Cached logged-in session reused across manual/test sends
+        self._smtp_user = None
 
         # --- Manual Send ---
         self.manual_email_var = tk.StringVar()
@@ -101,7 +128,8 @@ class BulkEmailerApp:
                            "{{FIRST_NAME}} {{LAST_NAME}}"),
             "smtp_email": "",
             "smtp_password": "",
-            "preferred_send_time": "" # Empty means send now
+            "preferred_send_time": "", # Empty means send now
+            "concurrency": 5 # Parallel SMTP connections for bulk sends
         }
 
     def save_app_config(self):
@@ -208,7 +236,7 @@ class BulkEmailerApp:
         self.update_column_mapping_dropdowns()
         self.log_message(f"Profile '{profile_name}' loaded.")
         # If CSVs were previously loaded in this session, re-verify mappings
-        if self.csv_data:
+        if self.csv_row_count:
             self.log_message("CSV data is present from this session. Review mappings if profile changed.")
 
 
@@ -339,18 +367,19 @@ class BulkEmailerApp:
         mapping_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         ttk.Label(mapping_frame, text="CSV Column for Email Address (Required):").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        self.email_column_menu = ttk.OptionMenu(mapping_frame, self.email_column_var, "Select Email Column", *[""])
+        if not self.email_column_var.get(): self.email_column_var.set("Select Email Column")
+        self.email_column_menu = ttk.Combobox(mapping_frame, textvariable=self.email_column_var, values=("Not Mapped",), state="readonly")
         self.email_column_menu.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-        
+
         ttk.Label(mapping_frame, text="--- Map Placeholders to CSV Columns (Auto-detected where possible): ---").grid(row=1, column=0, columnspan=2, pady=(10,2))
-        
+
         self.placeholder_menus = {}
         current_row = 2
-        for key, placeholder_text in DEFAULT_PLACEHOLDERS.items():
+        for key, placeholder_text in _PLACEHOLDER_ITEMS:
             label_text = f"{key.replace('_', ' ').title()} ({placeholder_text}):"
             ttk.Label(mapping_frame, text=label_text).grid(row=current_row, column=0, padx=5, pady=3, sticky="w")
             var = self.column_mappings[key]
-            menu = ttk.OptionMenu(mapping_frame, var, var.get() or "Not Mapped", *self.csv_headers if self.csv_headers else ["Not Mapped"])
+            menu = ttk.Combobox(mapping_frame, textvariable=var, values=("Not Mapped",), state="readonly")
             menu.grid(row=current_row, column=1, padx=5, pady=3, sticky="ew")
             self.placeholder_menus[key] = menu
             current_row += 1
@@ -445,6 +474,13 @@ class BulkEmailerApp:
     def on_closing(self):
         if messagebox.askokcancel("Quit", "Save all changes to profiles before quitting?"):
             self.save_app_config()
+        if self._scheduled_timer is not None:
+            self._scheduled_timer.cancel()
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
         self.root.destroy()
 
     def log_message(self, message, error=False):
@@ -457,7 +493,6 @@ class BulkEmailerApp:
         self.log_text.tag_config("info_tag", foreground="black")
         self.log_text.see(tk.END)
         self.log_text.config(state='disabled')
-        if self.root: self.root.update_idletasks()
 
     def _auto_detect_columns(self):
         if not self.csv_headers: return
@@ -486,7 +521,8 @@ class BulkEmailerApp:
 
 
     def _load_csv_data_from_paths(self, file_paths, silent=False):
-        self.csv_data = []
+        self.csv_columns = {}
+        self.csv_row_count = 0
         combined_headers = set()
         all_rows = []
 
@@ -498,19 +534,27 @@ class BulkEmailerApp:
 
         for file_path in file_paths:
             try:
-                with open(file_path, mode='r', encoding='utf-8-sig', newline='') as file:
-                    reader = csv.DictReader(file)
-                    if not reader.fieldnames:
-                        if not silent: messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' is empty or has no headers. Skipping.")
-                        continue
-                    
-                    current_file_rows = list(reader)
-                    if not current_file_rows and not silent:
-                         messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' has headers but no data rows.")
-                    
-                    all_rows.extend(current_file_rows)
-                    for header in reader.fieldnames:
-                        combined_headers.add(header)
+                if pacsv is not None:
+                    table = pacsv.read_csv(file_path, read_options=pacsv.ReadOptions(encoding='utf-8-sig'))
+                    fieldnames = table.schema.names
+                    # Arrow leaves empty cells as None; normalize to "" like DictReader's restval
+                    current_file_rows = [{k: ("" if v is None else v) for k, v in row.items()}
+                                         for row in table.to_pylist()]
+                else:
+                    with open(file_path, mode='r', encoding='utf-8-sig', newline='') as file:
+                        reader = csv.DictReader(file)
+                        fieldnames = reader.fieldnames
+                        current_file_rows = list(reader) if fieldnames else []
+                if not fieldnames:
+                    if not silent: messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' is empty or has no headers. Skipping.")
+                    continue
+
+                if not current_file_rows and not silent:
+                     messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' has headers but no data rows.")
+
+                all_rows.extend(current_file_rows)
+                for header in fieldnames:
+                    combined_headers.add(header)
                 if not silent: self.log_message(f"Successfully processed {os.path.basename(file_path)}.")
             except Exception as e:
                 if not silent:
@@ -519,12 +563,17 @@ class BulkEmailerApp:
                 # Continue to try and load other files
         
         self.csv_headers = sorted(list(combined_headers))
-        self.csv_data = all_rows
-
-        if not self.csv_data and not silent and file_paths:
+        # Store column-wise (SoA): one list per header instead of one dict per row,
+        # which drops the per-row dict overhead and keeps column reads contiguous.
+        for header in self.csv_headers:
+            self.csv_columns[header] = [("" if value is None else value)
+                                        for value in (row.get(header) for row in all_rows)]
+        self.csv_row_count = len(all_rows)
+
+        if not self.csv_row_count and not silent and file_paths:
              self.log_message("Warning: All loaded CSVs combined resulted in no data rows.", error=True)
-        elif self.csv_data:
-             self.log_message(f"Total {len(self.csv_data)} rows loaded from {len(file_paths)} CSV file(s).")
+        elif self.csv_row_count:
+             self.log_message(f"Total {self.csv_row_count} rows loaded from {len(file_paths)} CSV file(s).")
         
         self.csv_paths_label.config(text=f"{len(file_paths)} CSV(s) loaded: " + ", ".join([os.path.basename(p) for p in file_paths]))
         self._auto_detect_columns()
@@ -532,6 +581,11 @@ class BulkEmailerApp:
         return True
 
 
+    def _first_csv_row(self):
+        """Reassembles the first data row as a header->value dict (for previews/tests)."""
+        if not self.csv_row_count: return None
+        return {col: values[0] for col, values in self.csv_columns.items()}
+
     def load_csv_files(self):
         # Using askopenfilenames to select multiple files
         filepaths = filedialog.askopenfilenames(
@@ -561,42 +615,34 @@ class BulkEmailerApp:
 
     def update_column_mapping_dropdowns(self):
         options = ["Not Mapped"] + (self.csv_headers if self.csv_headers else [])
-        
-        # Update Email Column Dropdown
-        if hasattr(self, 'email_column_menu'):
-            current_email_col = self.email_column_var.get()
-            self.email_column_menu['menu'].delete(0, 'end')
-            for option_val in options:
-                self.email_column_menu['menu'].add_command(label=option_val, command=tk._setit(self.email_column_var, option_val))
-            
-            if current_email_col in options: self.email_column_var.set(current_email_col)
-            elif options and options[0] != "Not Mapped" and self.email_column_var.get() == "Select Email Column": self.email_column_var.set(options[0])
-            elif not options: self.email_column_var.set("")
 
-        # Update Placeholder Mapping Dropdowns
+        # Refill the widgets only when the header set actually changed; a Combobox
+        # takes its whole option list in one Tcl call instead of one per entry.
+        if options != getattr(self, '_last_menu_headers', None):
+            values = tuple(options)
+            if hasattr(self, 'email_column_menu'):
+                self.email_column_menu['values'] = values
+                self._last_menu_headers = options # Only remember once the widgets exist
+            if hasattr(self, 'placeholder_menus'):
+                for menu in self.placeholder_menus.values():
+                    menu['values'] = values
+
+        # Re-point the mapping vars at valid selections
         if hasattr(self, 'placeholder_menus'):
             for key, menu in self.placeholder_menus.items():
-                current_selection = self.column_mappings[key].get()
-                menu['menu'].delete(0, 'end')
-                for option_val in options:
-                    menu['menu'].add_command(label=option_val, command=tk._setit(self.column_mappings[key], option_val))
-                
-                if current_selection in options: self.column_mappings[key].set(current_selection)
-                elif options: self.column_mappings[key].set(options[0]) # Default to "Not Mapped"
-                else: self.column_mappings[key].set("")
-        
+                if self.column_mappings[key].get() not in options:
+                    self.column_mappings[key].set(options[0]) # Default to "Not Mapped"
+
         self.update_column_mapping_dropdowns_state()
 
     def update_column_mapping_dropdowns_state(self):
-        state = tk.NORMAL if self.csv_headers else tk.DISABLED
+        state = "readonly" if self.csv_headers else "disabled"
         if hasattr(self, 'email_column_menu'): self.email_column_menu.config(state=state)
         if hasattr(self, 'placeholder_menus'):
             for menu in self.placeholder_menus.values(): menu.config(state=state)
 
     def _is_valid_email(self, email_string):
-        if not email_string or not isinstance(email_string, str): return False
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return re.match(pattern, email_string) is not None
+        return bool(email_string) and isinstance(email_string, str) and _EMAIL_RE.match(email_string) is not None
 
     def _validate_send_time_format(self, time_str):
         if not time_str: return True # Empty is valid (send now)
@@ -621,20 +667,17 @@ class BulkEmailerApp:
             preview_fill_data[DEFAULT_PLACEHOLDERS["COMPANY_NAME"]] = self.manual_company_name_var.get() or "[MANUAL_COMPANY_NAME]"
             preview_fill_data[DEFAULT_PLACEHOLDERS["ROLE"]] = self.manual_role_var.get() or "[MANUAL_ROLE]"
         else:
-            if not self.csv_data: messagebox.showinfo("Preview Info", "Load CSV data to preview bulk email."); return
-            first_row = self.csv_data[0]
-            for key, placeholder in DEFAULT_PLACEHOLDERS.items():
+            if not self.csv_row_count: messagebox.showinfo("Preview Info", "Load CSV data to preview bulk email."); return
+            first_row = self._first_csv_row()
+            for key, placeholder in _PLACEHOLDER_ITEMS:
                 csv_col_name = self.column_mappings[key].get()
                 if csv_col_name and csv_col_name != "Not Mapped" and csv_col_name in first_row:
                     preview_fill_data[placeholder] = first_row[csv_col_name]
                 else:
                     preview_fill_data[placeholder] = f"[{key.upper()}_DATA_MISSING_OR_NOT_MAPPED]"
         
-        final_subject = subject_template
-        final_body = body_template
-        for placeholder, value in preview_fill_data.items():
-            final_subject = final_subject.replace(placeholder, str(value))
-            final_body = final_body.replace(placeholder, str(value))
+        final_subject = _render_template(subject_template, preview_fill_data)
+        final_body = _render_template(body_template, preview_fill_data)
         
         preview_window = tk.Toplevel(self.root)
         preview_window.title("Email Preview")
@@ -652,96 +695,208 @@ class BulkEmailerApp:
         ttk.Button(preview_window, text="Close", command=preview_window.destroy).pack(pady=10)
 
 
+    def _get_smtp(self, sender_email, sender_password):
+        """Returns a cached logged-in SMTP session, reconnecting only when it has gone stale.
+
+        Amortizes the TLS+AUTH handshake (hundreds of ms) across repeated
+        single-message sends; bulk sends use their own per-worker connections.
+        """
+        import smtplib # Deferred: cached in sys.modules after the first send
+        server = self._smtp
+        if server is not None and self._smtp_user == sender_email:
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except Exception:
+                pass # Stale/dropped connection; fall through and reconnect
+        if server is not None:
+            try:
+                server.close()
+            except Exception:
+                pass
+            self._smtp = None
+        server = smtplib.SMTP("smtp.gmail.com", 587)
+        server.starttls()
+        server.login(sender_email, sender_password)
+        self._smtp = server
+        self._smtp_user = sender_email
+        return server
+
     def _perform_email_sending(self, emails_to_send_list, is_test=False, manual_data=None):
         # This internal method handles the actual SMTP communication and looping
         # emails_to_send_list is a list of dictionaries, each with 'recipient_email', 'subject', 'body'
         # manual_data is used for test send from manual mode if needed
 
+        # Deferred imports: only send paths pay for smtplib/email.*, and repeat
+        # sends hit the sys.modules cache
+        import smtplib
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+        from email.mime.base import MIMEBase
+        from email.charset import Charset
+        from email import policy
+
         cv_path = self.cv_file_path.get() # From active profile
         sender_email = self.smtp_email_var.get()
         sender_password = self.smtp_password_var.get()
+        cv_attachable = bool(cv_path) and os.path.exists(cv_path) # One stat per batch
 
         if not is_test: # For bulk sending, re-check CV path
-             if not cv_path or not os.path.exists(cv_path): messagebox.showerror("Error", "CV file for active profile not found."); self.send_button.config(state=tk.NORMAL); return
+             if not cv_attachable: messagebox.showerror("Error", "CV file for active profile not found."); self.send_button.config(state=tk.NORMAL); return
              if not cv_path.lower().endswith(".pdf"): messagebox.showerror("Error", "CV must be a PDF."); self.send_button.config(state=tk.NORMAL); return
 
-        self.log_message(f"Starting SMTP process for {len(emails_to_send_list)} email(s)...")
+        try:
+            concurrency = int(self.profiles.get(self.active_profile_name.get(), {}).get("concurrency", 5))
+        except (TypeError, ValueError):
+            concurrency = 5
+        concurrency = max(1, min(concurrency, SMTP_MAX_CONNECTIONS, len(emails_to_send_list)))
+
+        # Read and base64-encode the CV once for the whole batch instead of per recipient
+        cv_b64 = None
+        cv_filename = None
+        if cv_attachable:
+            try:
+                with open(cv_path, "rb") as attachment_file:
+                    cv_b64 = base64.encodebytes(attachment_file.read())
+                cv_filename = os.path.basename(cv_path)
+            except Exception as e:
+                self.log_message(f"Failed to read CV '{os.path.basename(cv_path)}': {e}", error=True)
+                if not is_test: # Bulk sends should not silently go out without the CV
+                    messagebox.showerror("Error", f"Could not read CV file: {e}")
+                    return
+                # For test, log error but proceed to see if email sends without CV
+
+        self.log_message(f"Starting SMTP process for {len(emails_to_send_list)} email(s) on {concurrency} connection(s)...")
         if hasattr(self, 'send_button'): self.send_button.config(state=tk.DISABLED)
         if hasattr(self, 'progress_bar'): self.progress_bar['value'] = 0; self.progress_bar['maximum'] = len(emails_to_send_list)
-
-        sent_count = 0
-        failed_count = 0
-
-        try:
+        self._last_progress_step = 0; self._last_progress_ts = time.monotonic()
+
+        # Static parts of the message (From header, CV attachment) are assembled once;
+        # workers clone this template and only add To/Subject/body per recipient.
+        utf8_charset = Charset('utf-8') # Passing a string makes MIMEText build one of these per message
+        msg_template = MIMEMultipart()
+        msg_template['From'] = sender_email
+        if cv_b64 is not None:
+            part = MIMEBase('application', 'octet-stream')
+            part.set_payload(cv_b64)
+            part.add_header('Content-Transfer-Encoding', 'base64')
+            part.add_header('Content-Disposition', f"attachment; filename= {cv_filename}")
+            msg_template.attach(part)
+
+        work_q = queue.Queue()
+        for email_details in emails_to_send_list:
+            work_q.put(email_details)
+
+        counts = {'sent': 0, 'done': 0}
+        counts_lock = threading.Lock()
+
+        def log_async(message, error=False):
+            # Workers run off the Tk thread; marshal log calls back onto it
+            self.root.after(0, self.log_message, message, error)
+
+        def smtp_connect():
             server = smtplib.SMTP("smtp.gmail.com", 587)
             server.starttls()
             server.login(sender_email, sender_password)
-            self.log_message("Logged into Gmail SMTP server.")
+            return server
 
-            for i, email_details in enumerate(emails_to_send_list):
-                recipient_email = email_details['recipient_email']
-                current_subject = email_details['subject']
-                current_body = email_details['body']
-                row_identifier = email_details.get('row_identifier', f"item {i+1}")
+        # Single-message sends (manual/test) reuse one cached session so repeated
+        # clicks don't pay the TLS+AUTH handshake every time.
+        reuse_session = len(emails_to_send_list) == 1
 
+        def worker():
+            try:
+                server = self._get_smtp(sender_email, sender_password) if reuse_session else smtp_connect()
+            except smtplib.SMTPAuthenticationError:
+                log_async("SMTP Authentication Error. Check Gmail & App Password. Use App Password for 2FA.", error=True)
+                return
+            except Exception as e:
+                log_async(f"Could not open SMTP connection: {e}", error=True)
+                return
+            while True:
+                try:
+                    email_details = work_q.get_nowait()
+                except queue.Empty:
+                    break
+                recipient_email = email_details['recipient_email']
+                row_identifier = email_details.get('row_identifier', "item")
 
-                msg = MIMEMultipart()
-                msg['From'] = sender_email
+                # Shallow-clone the template: fresh header list and payload list so the
+                # clone can be mutated, but the CV part object itself is shared.
+                msg = copy.copy(msg_template)
+                msg._headers = list(msg_template._headers)
+                msg.set_payload([MIMEText(email_details['body'], 'plain', utf8_charset)] + msg_template.get_payload())
                 msg['To'] = recipient_email
-                msg['Subject'] = current_subject
-                msg.attach(MIMEText(current_body, 'plain', 'utf-8'))
-
-                if cv_path and os.path.exists(cv_path): # Attach CV if path is valid
-                    try:
-                        with open(cv_path, "rb") as attachment_file:
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(attachment_file.read())
-                        encoders.encode_base64(part)
-                        part.add_header('Content-Disposition', f"attachment; filename= {os.path.basename(cv_path)}")
-                        msg.attach(part)
-                    except Exception as e:
-                        self.log_message(f"Failed to attach CV for {recipient_email} ({row_identifier}): {e}", error=True)
-                        if not is_test: failed_count += 1; self.update_progress(i + 1); continue 
-                        # For test, log error but proceed to see if email sends without CV
-                
+                msg['Subject'] = email_details['subject']
+
+                # Serialize once, straight to wire-format bytes; as_string() would
+                # build a str only for smtplib to re-encode it for the socket.
+                msg_bytes = msg.as_bytes(policy=policy.SMTP)
+
+                sent_ok = False
                 try:
-                    server.sendmail(sender_email, recipient_email, msg.as_string())
-                    self.log_message(f"Email sent to {recipient_email} ({row_identifier})")
-                    sent_count += 1
+                    server.sendmail(sender_email, recipient_email, msg_bytes)
+                    sent_ok = True
+                except smtplib.SMTPServerDisconnected:
+                    try: # Reconnect once and retry this recipient
+                        server = smtp_connect()
+                        if reuse_session:
+                            self._smtp = server; self._smtp_user = sender_email
+                        server.sendmail(sender_email, recipient_email, msg_bytes)
+                        sent_ok = True
+                    except Exception as e:
+                        log_async(f"Failed to send email to {recipient_email} ({row_identifier}): {e}", error=True)
                 except Exception as e:
-                    self.log_message(f"Failed to send email to {recipient_email} ({row_identifier}): {e}", error=True)
-                    if not is_test: failed_count += 1
-                
-                if not is_test: self.update_progress(i + 1)
-                time.sleep(0.1) # Small delay to allow UI to update and be gentle on server
-
-            server.quit()
-            self.log_message("Disconnected from SMTP server.")
-
-        except smtplib.SMTPAuthenticationError:
-            err = "SMTP Authentication Error. Check Gmail & App Password. Use App Password for 2FA."
-            self.log_message(err, error=True); messagebox.showerror("SMTP Auth Error", err)
-            if not is_test: failed_count = len(emails_to_send_list) - sent_count
-        except smtplib.SMTPConnectError:
-            err = "SMTP Connection Error. Could not connect. Check internet."
-            self.log_message(err, error=True); messagebox.showerror("SMTP Connection Error", err)
-            if not is_test: failed_count = len(emails_to_send_list) - sent_count
-        except Exception as e:
-            self.log_message(f"An unexpected error during sending: {e}", error=True); messagebox.showerror("Sending Error", f"Unexpected error: {e}")
-        finally:
+                    log_async(f"Failed to send email to {recipient_email} ({row_identifier}): {e}", error=True)
+                if sent_ok:
+                    log_async(f"Email sent to {recipient_email} ({row_identifier})")
+
+                with counts_lock:
+                    if sent_ok: counts['sent'] += 1
+                    counts['done'] += 1
+                    done = counts['done']
+                if not is_test: self.update_progress(done)
+            if not reuse_session: # Cached single-send session stays open for the next click
+                try:
+                    server.quit()
+                except Exception:
+                    pass
+
+        def finish():
+            sent_count = counts['sent']
+            failed_count = len(emails_to_send_list) - sent_count
             self.log_message(f"Process finished. Sent: {sent_count}, Failed: {failed_count if not is_test else 'N/A for test'}.")
             if hasattr(self, 'send_button'): self.send_button.config(state=tk.NORMAL)
             if hasattr(self, 'progress_bar') and not is_test : self.progress_bar['value'] = self.progress_bar['maximum'] # Fill bar at end
 
+        workers = [threading.Thread(target=worker, daemon=True, name=f"smtp-worker-{n}")
+                   for n in range(concurrency)]
+        for t in workers:
+            t.start()
+
+        def supervise():
+            for t in workers:
+                t.join()
+            self.root.after(0, finish)
+
+        threading.Thread(target=supervise, daemon=True).start()
+
     def update_progress(self, current_step):
-        if hasattr(self, 'progress_bar'):
-            self.progress_bar['value'] = current_step
-            self.root.update_idletasks()
+        # Safe to call from worker threads: the actual widget write is queued
+        # onto the Tk event loop instead of forcing update_idletasks. Flushes are
+        # throttled to every 10 messages or 200 ms; finish() paints the final value.
+        if not hasattr(self, 'progress_bar'): return
+        now = time.monotonic()
+        if current_step - self._last_progress_step < 10 and now - self._last_progress_ts < 0.2:
+            return
+        self._last_progress_step = current_step
+        self._last_progress_ts = now
+        self.root.after(0, lambda: self.progress_bar.configure(value=current_step))
 
 
     def send_emails_process(self):
         # --- Validations ---
-        if not self.csv_data: messagebox.showerror("Error", "No CSV data loaded."); return
+        if not self.csv_row_count: messagebox.showerror("Error", "No CSV data loaded."); return
         
         email_col_name = self.email_column_var.get()
         if not email_col_name or email_col_name == "Not Mapped" or email_col_name not in self.csv_headers:
@@ -766,23 +921,49 @@ class BulkEmailerApp:
 
 
         # Prepare list of emails
-        emails_to_send_list = []
-        for i, row_data in enumerate(self.csv_data):
-            recipient_email = row_data.get(email_col_name)
-            if not recipient_email or not self._is_valid_email(recipient_email):
+        # Snapshot the Tk mapping vars once; StringVar.get() crosses into Tcl and
+        # is far too expensive to call per row x per placeholder.
+        placeholder_cols = [(placeholder, self.column_mappings[key].get())
+                            for key, placeholder in _PLACEHOLDER_ITEMS]
+
+        # Resolve each placeholder to its column list once; None means "render as empty"
+        placeholder_columns = []
+        for placeholder, csv_col_for_placeholder in placeholder_cols:
+            column = None
+            if csv_col_for_placeholder and csv_col_for_placeholder != "Not Mapped":
+                column = self.csv_columns.get(csv_col_for_placeholder)
+            placeholder_columns.append((placeholder, column))
+
+        # Validate the whole email column in one tight pass first, so invalid rows
+        # are dropped before any template work and the regex stays in a bound local.
+        match_email = _EMAIL_RE.match
+        valid_rows = []
+        seen_recipients = set() # Bulk CSVs commonly repeat addresses; send each one once
+        for i, recipient_email in enumerate(self.csv_columns.get(email_col_name, [])):
+            if isinstance(recipient_email, str) and match_email(recipient_email):
+                recipient_key = recipient_email.lower()
+                if recipient_key in seen_recipients:
+                    self.log_message(f"Skipping row {i+1}: Duplicate email '{recipient_email}'.")
+                    continue
+                seen_recipients.add(recipient_key)
+                valid_rows.append((i, recipient_email))
+            else:
                 self.log_message(f"Skipping row {i+1}: Invalid/missing email '{recipient_email}'.", error=True)
-                continue
-            
-            current_subject = subject_template
-            current_body = body_template
-            for key, placeholder in DEFAULT_PLACEHOLDERS.items():
-                csv_col_for_placeholder = self.column_mappings[key].get()
-                value_to_insert = ""
-                if csv_col_for_placeholder and csv_col_for_placeholder != "Not Mapped" and csv_col_for_placeholder in row_data:
-                    value_to_insert = row_data[csv_col_for_placeholder]
-                current_subject = current_subject.replace(placeholder, str(value_to_insert))
-                current_body = current_body.replace(placeholder, str(value_to_insert))
-            
+
+        emails_to_send_list = []
+        render_cache = {} # Rows sharing identical placeholder values render only once
+        for i, recipient_email in valid_rows:
+            values_key = tuple(column[i] if column is not None else ""
+                               for _placeholder, column in placeholder_columns)
+            rendered = render_cache.get(values_key)
+            if rendered is None:
+                fill_values = {placeholder: value
+                               for (placeholder, _column), value in zip(placeholder_columns, values_key)}
+                rendered = (_render_template(subject_template, fill_values),
+                            _render_template(body_template, fill_values))
+                render_cache[values_key] = rendered
+            current_subject, current_body = rendered
+
             emails_to_send_list.append({
                 'recipient_email': recipient_email, 
                 'subject': current_subject, 
@@ -809,12 +990,17 @@ class BulkEmailerApp:
                      messagebox.showerror("Schedule Error", f"Scheduled time {send_time_str} is in the past for today. Please choose a future time for today or clear it to send now.")
                      return
 
-                delay_ms = int((scheduled_dt - now).total_seconds() * 1000)
+                delay_seconds = (scheduled_dt - now).total_seconds()
                 if not messagebox.askyesno("Confirm Schedule", f"Schedule sending of {len(emails_to_send_list)} emails for {send_time_str} today? The app must remain open."):
                     return
-                
-                self.log_message(f"Emails scheduled for {send_time_str}. App must remain open. Delaying for {delay_ms/1000:.0f}s.")
-                self.root.after(delay_ms, lambda: self._perform_email_sending(emails_to_send_list))
+
+                self.log_message(f"Emails scheduled for {scheduled_dt.strftime('%H:%M')} today. App must remain open.")
+                # A Timer thread keeps the schedule independent of Tk event-loop jitter;
+                # firing hops back onto the Tk thread, where the send just spawns its workers.
+                self._scheduled_timer = threading.Timer(
+                    delay_seconds, lambda: self.root.after(0, self._perform_email_sending, emails_to_send_list))
+                self._scheduled_timer.daemon = True
+                self._scheduled_timer.start()
             except ValueError:
                 messagebox.showerror("Error", "Invalid time format in 'Preferred Send Time'. Use HH:MM."); return
         else: # Send immediately
@@ -849,15 +1035,14 @@ class BulkEmailerApp:
 
 
         # Personalize
-        current_subject = subject_template.replace(DEFAULT_PLACEHOLDERS["FIRST_NAME"], first_name)
-        current_subject = current_subject.replace(DEFAULT_PLACEHOLDERS["COMPANY_NAME"], company_name)
-        current_subject = current_subject.replace(DEFAULT_PLACEHOLDERS["ROLE"], role)
-        current_subject = current_subject.replace(DEFAULT_PLACEHOLDERS["LAST_NAME"], "") # No last name in manual
-
-        current_body = body_template.replace(DEFAULT_PLACEHOLDERS["FIRST_NAME"], first_name)
-        current_body = current_body.replace(DEFAULT_PLACEHOLDERS["COMPANY_NAME"], company_name)
-        current_body = current_body.replace(DEFAULT_PLACEHOLDERS["ROLE"], role)
-        current_body = current_body.replace(DEFAULT_PLACEHOLDERS["LAST_NAME"], "")
+        manual_fill_data = {
+            DEFAULT_PLACEHOLDERS["FIRST_NAME"]: first_name,
+            DEFAULT_PLACEHOLDERS["COMPANY_NAME"]: company_name,
+            DEFAULT_PLACEHOLDERS["ROLE"]: role,
+            DEFAULT_PLACEHOLDERS["LAST_NAME"]: "", # No last name in manual
+        }
+        current_subject = _render_template(subject_template, manual_fill_data)
+        current_body = _render_template(body_template, manual_fill_data)
 
         email_details = [{'recipient_email': recipient_email, 'subject': current_subject, 'body': current_body, 'row_identifier': "Manual Send"}]
         
@@ -886,10 +1071,10 @@ class BulkEmailerApp:
             test_fill_data[DEFAULT_PLACEHOLDERS["LAST_NAME"]] = "[TEST_LAST_NAME]" # Not in manual form
             test_fill_data[DEFAULT_PLACEHOLDERS["COMPANY_NAME"]] = self.manual_company_name_var.get() or "[TEST_COMPANY]"
             test_fill_data[DEFAULT_PLACEHOLDERS["ROLE"]] = self.manual_role_var.get() or "[TEST_ROLE]"
-        elif self.csv_data:
+        elif self.csv_row_count:
             self.log_message("Preparing test email using data from the first CSV row.")
-            first_row = self.csv_data[0]
-            for key, placeholder in DEFAULT_PLACEHOLDERS.items():
+            first_row = self._first_csv_row()
+            for key, placeholder in _PLACEHOLDER_ITEMS:
                 csv_col_name = self.column_mappings[key].get()
                 if csv_col_name and csv_col_name != "Not Mapped" and csv_col_name in first_row:
                     test_fill_data[placeholder] = first_row[csv_col_name]
@@ -897,14 +1082,11 @@ class BulkEmailerApp:
                     test_fill_data[placeholder] = f"[{key.upper()}_TEST_DATA]"
         else:
             self.log_message("Preparing test email using generic placeholder data.")
-            for key, placeholder in DEFAULT_PLACEHOLDERS.items():
+            for key, placeholder in _PLACEHOLDER_ITEMS:
                 test_fill_data[placeholder] = f"[{key.upper()}_TEST_DATA]"
 
-        current_subject = subject_template
-        current_body = body_template
-        for placeholder, value in test_fill_data.items():
-            current_subject = current_subject.replace(placeholder, str(value))
-            current_body = current_body.replace(placeholder, str(value))
+        current_subject = _render_template(subject_template, test_fill_data)
+        current_body = _render_template(body_template, test_fill_data)
 
         email_details = [{'recipient_email': sender_email, 'subject': f"[TEST] {current_subject}", 'body': current_body, 'row_identifier': "Test Email"}]
         
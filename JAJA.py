@@ -5,13 +5,41 @@ import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
-from email import encoders
+from email import encoders, policy
 import json
 import os
+import copy # Cloning the prebuilt MIME template per recipient
+import mmap # Zero-copy reads of large CSV files
 import re # For email validation
 import datetime
 import time # For progress bar updates and basic scheduling
 import uuid # For unique campaign IDs
+import threading # Bulk sending runs off the Tk main loop
+import queue # Event queue between sender thread and UI
+import collections # deque for the log buffer
+import itertools # islice for capped row scans
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow.csv as pacsv # Optional: C-accelerated CSV parsing for large files
+except ImportError:
+    pacsv = None
+
+try:
+    import keyring # Optional: keeps SMTP passwords out of the config JSON
+except ImportError:
+    keyring = None
+
+KEYRING_SERVICE = "bulk_emailer"
+KEYRING_SENTINEL = "__keyring__" # Stored in the profile in place of the real password
+
+try:
+    import orjson # Optional: C-accelerated JSON for config/campaign files
+    def _json_dumps(obj): return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj): return json.dumps(obj, indent=4).encode("utf-8")
+    _json_loads = json.loads
 
 CONFIG_FILE = "bulk_emailer_config_profiles.json"
 SCHEDULED_CAMPAIGNS_FILE = "scheduled_campaigns.json" # For persistent scheduled jobs
@@ -23,30 +51,65 @@ DEFAULT_PLACEHOLDERS = {
     "ROLE": "{{ROLE}}",
 }
 
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+_PLACEHOLDER_RE = re.compile(r"\{\{(" + "|".join(map(re.escape, DEFAULT_PLACEHOLDERS)) + r")\}\}")
+
+def _render_template(template, values):
+    """Fills every {{PLACEHOLDER}} in one pass; missing keys become empty strings."""
+    return _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), ""), template)
+
 AUTO_DETECT_PATTERNS = {
-    "email_column": ['email', 'e-mail', 'email address', 'e mail'],
-    "FIRST_NAME": ['firstname', 'first name', 'given name', 'first', 'fname'],
-    "LAST_NAME": ['lastname', 'last name', 'surname', 'lname'],
-    "COMPANY_NAME": ['companyname', 'company name', 'organization', 'company', 'employer'],
-    "ROLE": ['role', 'position', 'job title', 'applied for', 'job']
+    "email_column": ('email', 'e-mail', 'email address', 'e mail'),
+    "FIRST_NAME": ('firstname', 'first name', 'given name', 'first', 'fname'),
+    "LAST_NAME": ('lastname', 'last name', 'surname', 'lname'),
+    "COMPANY_NAME": ('companyname', 'company name', 'organization', 'company', 'employer'),
+    "ROLE": ('role', 'position', 'job title', 'applied for', 'job')
 }
 
 DEFAULT_PROFILE_NAME = "Default Profile"
 
+SMTP_MAX_SENDS_PER_CONNECTION = 95 # Gmail allows ~100 recipients per connection; cycle before the limit
+
+MAX_CSV_ROWS = 200_000 # Safety cap on total rows processed across all loaded CSVs
+
+def _iter_csv_lines(file_path):
+    """Yields decoded lines from a CSV file, reading through mmap when possible."""
+    with open(file_path, 'rb') as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError): # e.g. empty file; fall back to buffered reads
+            mm = fh
+        try:
+            line = mm.readline()
+            if line.startswith(b'\xef\xbb\xbf'): line = line[3:] # Strip UTF-8 BOM like utf-8-sig did
+            while line:
+                yield line.decode('utf-8')
+                line = mm.readline()
+        finally:
+            if mm is not fh: mm.close()
+
 class BulkEmailerApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Advanced Bulk Emailer (Batch Custom & Profile Scheduling)")
         self.root.geometry("1000x800") # Wider for new tab
 
+        self._log_buffer = collections.deque() # Coalesces log lines into one widget insert
+        self._log_flush_pending = False
+
         self.profiles = {}
         self.active_profile_name = tk.StringVar()
         self.profile_keys_for_dropdown = []
+        self._config_dirty = False # Skip config writes when nothing changed since last save
+        self._last_saved_active = None
 
-        self.csv_file_paths = [] 
-        self.cv_file_path = tk.StringVar() 
-        self.csv_headers = [] 
-        self.csv_data = [] 
+        self.csv_file_paths = []
+        self.cv_file_path = tk.StringVar()
+        self.csv_headers = []
+        self.csv_first_row = None # Cached for previews/tests; full rows are streamed on demand
+        self.csv_row_count = 0
+        self.max_rows = MAX_CSV_ROWS
 
         self.email_column_var = tk.StringVar()
         self.column_mappings = {key: tk.StringVar() for key in DEFAULT_PLACEHOLDERS}
@@ -73,6 +136,9 @@ class BulkEmailerApp:
 
         self.scheduled_campaigns = self.load_scheduled_campaigns_from_file()
         self.custom_email_batch = [] # List to hold custom email dicts
+        self._cv_part_cache = (None, None) # (path, encoded MIMEBase part)
+        self._event_q = queue.Queue() # (kind, ...) tuples pushed by the sender thread
+        self._send_thread = None
 
         self.load_app_config() 
         self.create_widgets()
@@ -86,8 +152,9 @@ class BulkEmailerApp:
         self.load_profile_data(self.active_profile_name.get()) # This will now load profile's schedule too
         self.update_column_mapping_dropdowns_state()
         
-        self.root.after(2000, self.check_for_pending_scheduled_jobs) 
-        self.root.after(60000, self.periodic_schedule_check) 
+        self.root.after(100, self._drain_events)
+        self.root.after(2000, self.check_for_pending_scheduled_jobs)
+        self.root.after(60000, self.periodic_schedule_check)
 
 
     def get_default_profile_settings(self):
@@ -108,27 +175,38 @@ class BulkEmailerApp:
 
     def save_app_config(self):
         self.save_current_profile_data_to_object()
+        if not self._config_dirty and self.active_profile_name.get() == self._last_saved_active:
+            self.log_message("Configuration unchanged; nothing to save."); return
         app_config = {"active_profile_name": self.active_profile_name.get(), "profiles": self.profiles}
+        tmp_path = CONFIG_FILE + ".tmp"
         try:
-            with open(CONFIG_FILE, "w") as f: json.dump(app_config, f, indent=4)
+            # Write to a temp file then rename so a crash mid-write can't corrupt the config
+            with open(tmp_path, "wb") as f: f.write(_json_dumps(app_config))
+            os.replace(tmp_path, CONFIG_FILE)
+            self._config_dirty = False; self._last_saved_active = self.active_profile_name.get()
             self.log_message("Application configuration (all profiles) saved.")
         except Exception as e: self.log_message(f"Error saving application configuration: {e}", error=True)
 
     def load_app_config(self):
         try:
-            if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, "r") as f: app_config = json.load(f)
+            try:
+                config_file = open(CONFIG_FILE, "rb") # EAFP: one syscall instead of exists()+open()
+            except FileNotFoundError:
+                config_file = None
+            if config_file is not None:
+                with config_file as f: app_config = _json_loads(f.read())
                 self.active_profile_name.set(app_config.get("active_profile_name", DEFAULT_PROFILE_NAME))
                 self.profiles = app_config.get("profiles", {})
                 if not self.profiles: 
                     self.profiles[DEFAULT_PROFILE_NAME] = self.get_default_profile_settings()
                     if not self.active_profile_name.get(): self.active_profile_name.set(DEFAULT_PROFILE_NAME)
                 self.profile_keys_for_dropdown = list(self.profiles.keys())
-                if not self.profile_keys_for_dropdown: 
+                if not self.profile_keys_for_dropdown:
                      self.profiles[DEFAULT_PROFILE_NAME] = self.get_default_profile_settings()
                      self.active_profile_name.set(DEFAULT_PROFILE_NAME)
                      self.profile_keys_for_dropdown = [DEFAULT_PROFILE_NAME]
-            else: 
+                self._last_saved_active = app_config.get("active_profile_name")
+            else:
                 self.active_profile_name.set(DEFAULT_PROFILE_NAME)
                 self.profiles[DEFAULT_PROFILE_NAME] = self.get_default_profile_settings()
                 self.profile_keys_for_dropdown = [DEFAULT_PROFILE_NAME]
@@ -141,19 +219,25 @@ class BulkEmailerApp:
     def save_current_profile_data_to_object(self):
         profile_name = self.active_profile_name.get()
         if not profile_name or profile_name not in self.profiles: return
-        if profile_name not in self.profiles: self.profiles[profile_name] = self.get_default_profile_settings()
-        
+
         current_profile_data = self.profiles[profile_name]
-        current_profile_data["cv_file_path"] = self.cv_file_path.get()
-        current_profile_data["email_column"] = self.email_column_var.get()
-        current_profile_data["column_mappings"] = {key: var.get() for key, var in self.column_mappings.items()}
-        current_profile_data["email_subject"] = self.email_subject_var.get()
-        if self.email_body_text_widget: current_profile_data["email_body"] = self.email_body_text_widget.get("1.0", tk.END).strip()
-        else: current_profile_data["email_body"] = self.profiles[profile_name].get("email_body","")
-        current_profile_data["smtp_email"] = self.smtp_email_var.get()
-        current_profile_data["smtp_password"] = self.smtp_password_var.get()
-        current_profile_data["schedule_date"] = self.profile_schedule_date_var.get() # Save profile's schedule
-        current_profile_data["schedule_time"] = self.profile_schedule_time_var.get()
+        new_data = dict(current_profile_data)
+        new_data["cv_file_path"] = self.cv_file_path.get()
+        new_data["email_column"] = self.email_column_var.get()
+        new_data["column_mappings"] = {key: var.get() for key, var in self.column_mappings.items()}
+        new_data["email_subject"] = self.email_subject_var.get()
+        if self.email_body_text_widget: new_data["email_body"] = self.email_body_text_widget.get("1.0", tk.END).strip()
+        else: new_data["email_body"] = current_profile_data.get("email_body","")
+        new_data["smtp_email"] = self.smtp_email_var.get()
+        password = self.smtp_password_var.get()
+        if keyring is not None and password:
+            try: keyring.set_password(KEYRING_SERVICE, profile_name, password); password = KEYRING_SENTINEL
+            except Exception as e: self.log_message(f"Keyring unavailable ({e}); storing password in config.", error=True)
+        new_data["smtp_password"] = password
+        new_data["schedule_date"] = self.profile_schedule_date_var.get() # Save profile's schedule
+        new_data["schedule_time"] = self.profile_schedule_time_var.get()
+        if new_data != current_profile_data:
+            self.profiles[profile_name] = new_data; self._config_dirty = True
 
     def load_profile_data(self, profile_name):
         if not profile_name or profile_name not in self.profiles:
@@ -173,7 +257,14 @@ class BulkEmailerApp:
             self.email_body_text_widget.delete("1.0", tk.END)
             self.email_body_text_widget.insert("1.0", profile_data.get("email_body", self.get_default_profile_settings()["email_body"]))
         self.smtp_email_var.set(profile_data.get("smtp_email", ""))
-        self.smtp_password_var.set(profile_data.get("smtp_password", ""))
+        stored_password = profile_data.get("smtp_password", "")
+        if stored_password == KEYRING_SENTINEL:
+            stored_password = ""
+            if keyring is not None:
+                try: stored_password = keyring.get_password(KEYRING_SERVICE, profile_name) or ""
+                except Exception as e: self.log_message(f"Could not read password from keyring: {e}", error=True)
+            else: self.log_message("Password for this profile is in the system keyring, but the keyring package is not installed.", error=True)
+        self.smtp_password_var.set(stored_password)
         # Load profile's schedule into its dedicated vars
         self.profile_schedule_date_var.set(profile_data.get("schedule_date", ""))
         self.profile_schedule_time_var.set(profile_data.get("schedule_time", ""))
@@ -208,7 +299,7 @@ class BulkEmailerApp:
                 new_profile_settings["schedule_date"] = active_profile_data.get("schedule_date", "") # Inherit schedule too
                 new_profile_settings["schedule_time"] = active_profile_data.get("schedule_time", "")
                 self.log_message(f"New profile '{profile_name}' inherited SMTP & Schedule from '{current_active_profile_name_for_inheritance}'.")
-        self.profiles[profile_name] = new_profile_settings
+        self.profiles[profile_name] = new_profile_settings; self._config_dirty = True
         self.profile_keys_for_dropdown = list(self.profiles.keys())
         self.update_profile_dropdown()
         if make_active:
@@ -222,7 +313,10 @@ class BulkEmailerApp:
             messagebox.showerror("Error", "Cannot delete the default profile or no profile selected."); return
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete profile '{profile_name_to_delete}'? This cannot be undone."):
             if profile_name_to_delete in self.profiles:
-                del self.profiles[profile_name_to_delete]
+                del self.profiles[profile_name_to_delete]; self._config_dirty = True
+                if keyring is not None:
+                    try: keyring.delete_password(KEYRING_SERVICE, profile_name_to_delete)
+                    except Exception: pass
                 self.profile_keys_for_dropdown = list(self.profiles.keys())
                 new_active = DEFAULT_PROFILE_NAME if DEFAULT_PROFILE_NAME in self.profiles else (self.profile_keys_for_dropdown[0] if self.profile_keys_for_dropdown else "")
                 self.active_profile_name.set(new_active); self.update_profile_dropdown() 
@@ -231,23 +325,18 @@ class BulkEmailerApp:
                 self.log_message(f"Profile '{profile_name_to_delete}' deleted."); self.save_app_config()
 
     def update_profile_dropdown(self):
-        if not hasattr(self, 'profile_menu'): return 
-        menu = self.profile_menu['menu']; menu.delete(0, 'end')
+        if not hasattr(self, 'profile_menu'): return
         if not self.profile_keys_for_dropdown and DEFAULT_PROFILE_NAME not in self.profiles:
             self.profiles[DEFAULT_PROFILE_NAME] = self.get_default_profile_settings()
             self.profile_keys_for_dropdown = [DEFAULT_PROFILE_NAME]
             if not self.active_profile_name.get(): self.active_profile_name.set(DEFAULT_PROFILE_NAME)
         elif not self.profile_keys_for_dropdown and DEFAULT_PROFILE_NAME in self.profiles:
              self.profile_keys_for_dropdown = [DEFAULT_PROFILE_NAME]
-        for profile_key in self.profile_keys_for_dropdown:
-            menu.add_command(label=profile_key, command=lambda pk=profile_key: self.set_and_load_profile(pk))
+        self.profile_menu['values'] = tuple(self.profile_keys_for_dropdown)
         current_active = self.active_profile_name.get()
         if current_active not in self.profile_keys_for_dropdown:
              if self.profile_keys_for_dropdown: self.active_profile_name.set(self.profile_keys_for_dropdown[0])
 
-    def set_and_load_profile(self, profile_key):
-        self.active_profile_name.set(profile_key); self.on_profile_selected()
-
     def create_widgets(self):
         main_container = ttk.Frame(self.root); main_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.notebook = ttk.Notebook(main_container); self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -261,6 +350,7 @@ class BulkEmailerApp:
         
         log_frame = ttk.LabelFrame(main_container, text="Log", padding=10); log_frame.pack(fill=tk.X, padx=5, pady=(10,5), side=tk.BOTTOM)
         self.log_text = scrolledtext.ScrolledText(log_frame, wrap=tk.WORD, height=5, state='disabled', font=("Helvetica", 9)); self.log_text.pack(fill=tk.X, expand=False)
+        self.log_text.tag_config("error_tag", foreground="red"); self.log_text.tag_config("info_tag", foreground="black")
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.update_profile_dropdown() 
 
@@ -271,7 +361,8 @@ class BulkEmailerApp:
         if not initial_active_profile or initial_active_profile not in self.profile_keys_for_dropdown:
             initial_active_profile = self.profile_keys_for_dropdown[0] if self.profile_keys_for_dropdown else "None"
             self.active_profile_name.set(initial_active_profile)
-        self.profile_menu = ttk.OptionMenu(profile_frame, self.active_profile_name, initial_active_profile, *(self.profile_keys_for_dropdown or ["None"]), command=self.on_profile_selected)
+        self.profile_menu = ttk.Combobox(profile_frame, textvariable=self.active_profile_name, values=tuple(self.profile_keys_for_dropdown or ["None"]), state="readonly")
+        self.profile_menu.bind('<<ComboboxSelected>>', self.on_profile_selected)
         self.profile_menu.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
         ttk.Button(profile_frame, text="New Profile", command=self.create_new_profile_dialog).grid(row=1, column=0, padx=5, pady=2, sticky="ew")
         ttk.Button(profile_frame, text="Save Active Profile Settings", command=self.save_app_config).grid(row=1, column=1, padx=5, pady=2, sticky="ew") 
@@ -395,60 +486,137 @@ class BulkEmailerApp:
 
     def on_closing(self):
         self.log_message("Closing application. Auto-saving all profiles and settings...")
-        self.save_app_config(); self.save_scheduled_campaigns_to_file() 
+        self.save_app_config(); self.save_scheduled_campaigns_to_file()
+        self._flush_log()
         self.root.destroy()
 
     def log_message(self, message, error=False):
         if not hasattr(self, 'log_text') or self.log_text is None: print(f"LOG ({'ERROR' if error else 'INFO'}): {message}"); return
+        self._log_buffer.append((datetime.datetime.now().strftime('%H:%M:%S'), message, error))
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            try: self.root.after(50, self._flush_log)
+            except tk.TclError: self._flush_log()
+
+    def _flush_log(self):
+        self._log_flush_pending = False
+        if not self._log_buffer: return
         try:
             self.log_text.config(state='normal')
-            self.log_text.insert(tk.END, f"{datetime.datetime.now().strftime('%H:%M:%S')} - {message}\n", "error_tag" if error else "info_tag")
-            self.log_text.tag_config("error_tag", foreground="red"); self.log_text.tag_config("info_tag", foreground="black")
+            while self._log_buffer:
+                ts, message, error = self._log_buffer.popleft()
+                self.log_text.insert(tk.END, f"{ts} - {message}\n", "error_tag" if error else "info_tag")
             self.log_text.see(tk.END); self.log_text.config(state='disabled')
-            if self.root and self.root.winfo_exists(): self.root.update_idletasks()
-        except tk.TclError: print(f"LOG (TclError suppressed): {message}")
+        except tk.TclError:
+            while self._log_buffer: print(f"LOG (TclError suppressed): {self._log_buffer.popleft()[1]}")
 
-    def _auto_detect_columns(self): # Same as before
+    def _auto_detect_columns(self):
         if not self.csv_headers: return
+        # Normalize each header once; detection is then a dict lookup per pattern
+        norm = {h.lower().replace(" ", "").replace("_", ""): h for h in self.csv_headers}
         current_email_col_setting = self.email_column_var.get()
         if not current_email_col_setting or current_email_col_setting not in self.csv_headers:
-            detected = False
-            for header in self.csv_headers:
-                if header.lower().replace(" ", "").replace("_", "") in AUTO_DETECT_PATTERNS["email_column"]:
-                    self.email_column_var.set(header); self.log_message(f"Auto-detected Email column: '{header}'"); detected = True; break
+            match = next((norm[p] for p in AUTO_DETECT_PATTERNS["email_column"] if p in norm), None)
+            if match: self.email_column_var.set(match); self.log_message(f"Auto-detected Email column: '{match}'")
         for key, patterns in AUTO_DETECT_PATTERNS.items():
             if key == "email_column": continue
             current_mapping = self.column_mappings[key].get()
             if not current_mapping or current_mapping == "Not Mapped" or current_mapping not in self.csv_headers:
-                detected_placeholder = False
-                for header in self.csv_headers:
-                    normalized_header = header.lower().replace(" ", "").replace("_", "")
-                    if normalized_header in patterns:
-                        self.column_mappings[key].set(header); self.log_message(f"Auto-detected {key.replace('_',' ').title()} column: '{header}'"); detected_placeholder = True; break
-                if not detected_placeholder and self.column_mappings[key].get() not in self.csv_headers: self.column_mappings[key].set("Not Mapped")
+                match = next((norm[p] for p in patterns if p in norm), None)
+                if match: self.column_mappings[key].set(match); self.log_message(f"Auto-detected {key.replace('_',' ').title()} column: '{match}'")
+                elif self.column_mappings[key].get() not in self.csv_headers: self.column_mappings[key].set("Not Mapped")
         self.update_column_mapping_dropdowns()
 
-    def _load_csv_data_from_paths(self, file_paths, silent=False): # Same as before
-        self.csv_data = []; combined_headers = set(); all_rows = []
-        if not file_paths: self.csv_headers = []; self.csv_paths_label.config(text="No CSVs loaded."); self.update_column_mapping_dropdowns(); return True 
-        for file_path in file_paths:
+    def _scan_csv_file(self, file_path, max_rows=None):
+        """Reads headers, a row count and the first data row without keeping rows in memory."""
+        if pacsv is not None:
+            first_row = None; row_count = 0
+            with pacsv.open_csv(file_path, read_options=pacsv.ReadOptions(encoding='utf-8-sig')) as reader:
+                fieldnames = reader.schema.names
+                for batch in reader:
+                    if first_row is None and batch.num_rows:
+                        # Arrow leaves empty cells as None; normalize to "" like DictReader's restval
+                        first_row = {k: ("" if v is None else v) for k, v in batch.slice(0, 1).to_pylist()[0].items()}
+                    row_count += batch.num_rows
+                    if max_rows is not None and row_count >= max_rows: row_count = max_rows; break
+            return fieldnames, row_count, first_row
+        reader = csv.DictReader(_iter_csv_lines(file_path))
+        fieldnames = reader.fieldnames
+        if not fieldnames: return None, 0, None
+        first_row = next(reader, None)
+        if first_row is None: return fieldnames, 0, None
+        rest = reader if max_rows is None else itertools.islice(reader, max(0, max_rows - 1))
+        return fieldnames, 1 + sum(1 for _ in rest), first_row
+
+    @staticmethod
+    def _row_value(row, col_index, col):
+        """Looks up a column in a (row_values, header->index) pair; missing or short columns give ""."""
+        i = col_index.get(col)
+        if i is None or i >= len(row): return ""
+        value = row[i]
+        return "" if value is None else value
+
+    def _iter_csv_rows(self):
+        """Yields (row_number, row_values, header->index map) across all loaded CSVs, one row at a time."""
+        row_num = 0
+        for file_path in self.csv_file_paths:
             try:
-                with open(file_path, mode='r', encoding='utf-8-sig', newline='') as file:
-                    reader = csv.DictReader(file)
-                    if not reader.fieldnames:
-                        if not silent: messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' is empty or has no headers. Skipping.")
-                        continue
-                    current_file_rows = list(reader)
-                    if not current_file_rows and not silent: messagebox.showwarning("CSV Warning", f"CSV file '{os.path.basename(file_path)}' has headers but no data rows.")
-                    all_rows.extend(current_file_rows)
-                    for header in reader.fieldnames: combined_headers.add(header)
-                if not silent: self.log_message(f"Successfully processed {os.path.basename(file_path)}.")
+                if pacsv is not None:
+                    with pacsv.open_csv(file_path, read_options=pacsv.ReadOptions(encoding='utf-8-sig')) as reader:
+                        col_index = {name: i for i, name in enumerate(reader.schema.names)}
+                        for batch in reader:
+                            for row in zip(*(col.to_pylist() for col in batch.columns)):
+                                row_num += 1
+                                yield row_num, row, col_index
+                                if row_num >= self.max_rows: return
+                else:
+                    reader = csv.reader(_iter_csv_lines(file_path))
+                    header = next(reader, None)
+                    if not header: continue
+                    col_index = {name: i for i, name in enumerate(header)}
+                    for row in reader:
+                        row_num += 1
+                        yield row_num, row, col_index
+                        if row_num >= self.max_rows: return
             except Exception as e:
-                if not silent: messagebox.showerror("CSV Error", f"Failed to load/parse {os.path.basename(file_path)}: {e}"); self.log_message(f"Failed to load {os.path.basename(file_path)}: {e}", error=True)
-        self.csv_headers = sorted(list(combined_headers)); self.csv_data = all_rows
-        if not self.csv_data and not silent and file_paths: self.log_message("Warning: All loaded CSVs combined resulted in no data rows.", error=False)
-        elif self.csv_data: self.log_message(f"Total {len(self.csv_data)} rows loaded from {len(file_paths)} CSV file(s).")
+                self.log_message(f"Failed to re-read {os.path.basename(file_path)}: {e}", error=True)
+
+    def _load_csv_data_from_paths(self, file_paths, silent=False):
+        self.csv_first_row = None; self.csv_row_count = 0; combined_headers = {} # dict as ordered set
+        if not file_paths: self.csv_headers = []; self.csv_paths_label.config(text="No CSVs loaded."); self.update_column_mapping_dropdowns(); return True
+        def scan_one(path):
+            try: return self._scan_csv_file(path, self.max_rows), None
+            except Exception as e: return None, e
+        if len(file_paths) > 1:
+            # File scans are independent and I/O-bound, so overlap them across threads.
+            with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as ex:
+                results = list(ex.map(scan_one, file_paths))
+        else:
+            results = [scan_one(file_paths[0])]
+        deferred_warnings = [] # Dialogs must wait until the merge loop is done (main thread only)
+        for file_path, (scan, err) in zip(file_paths, results):
+            if err is not None:
+                if not silent: deferred_warnings.append(("error", f"Failed to load/parse {os.path.basename(file_path)}: {err}"))
+                self.log_message(f"Failed to load {os.path.basename(file_path)}: {err}", error=True)
+                continue
+            fieldnames, row_count, first_row = scan
+            if not fieldnames:
+                if not silent: deferred_warnings.append(("warn", f"CSV file '{os.path.basename(file_path)}' is empty or has no headers. Skipping."))
+                continue
+            if not row_count and not silent: deferred_warnings.append(("warn", f"CSV file '{os.path.basename(file_path)}' has headers but no data rows."))
+            self.csv_row_count += row_count
+            if self.csv_first_row is None and first_row is not None: self.csv_first_row = first_row
+            combined_headers.update(dict.fromkeys(fieldnames))
+            if not silent: self.log_message(f"Successfully processed {os.path.basename(file_path)}.")
+        self.csv_row_count = min(self.csv_row_count, self.max_rows)
+        self.csv_headers = list(combined_headers)
+        if self.csv_row_count >= self.max_rows: self.log_message(f"Note: processing is capped at {self.max_rows} rows.", error=True)
+        if not self.csv_row_count and not silent and file_paths: self.log_message("Warning: All loaded CSVs combined resulted in no data rows.", error=False)
+        elif self.csv_row_count: self.log_message(f"Total {self.csv_row_count} rows found in {len(file_paths)} CSV file(s).")
         self.csv_paths_label.config(text=f"{len(file_paths)} CSV(s) loaded: " + ", ".join([os.path.basename(p) for p in file_paths]) if file_paths else "No CSVs loaded.")
+        for kind, text in deferred_warnings:
+            if kind == "error": messagebox.showerror("CSV Error", text)
+            else: messagebox.showwarning("CSV Warning", text)
         self._auto_detect_columns(); return True
 
     def load_csv_files(self): # Same as before
@@ -461,19 +629,26 @@ class BulkEmailerApp:
             if file_path.lower().endswith(".pdf"): self.cv_file_path.set(file_path); self.log_message(f"CV selected for current profile: {os.path.basename(file_path)}")
             else: messagebox.showerror("File Error", "Please select a PDF file for the CV.")
 
-    def update_column_mapping_dropdowns(self): # Same as before
+    def update_column_mapping_dropdowns(self): # Rebuilds menu entries only when headers actually changed
         options = ["Not Mapped"] + (self.csv_headers if self.csv_headers else [])
+        sig = tuple(self.csv_headers)
+        rebuild = sig != getattr(self, '_last_headers_sig', None)
         if hasattr(self, 'email_column_menu'):
-            current_email_col_val = self.email_column_var.get(); self.email_column_menu['menu'].delete(0, 'end')
+            current_email_col_val = self.email_column_var.get()
             default_email_option = current_email_col_val if current_email_col_val in options else options[0]
-            self.email_column_var.set(default_email_option) 
-            for option_val in options: self.email_column_menu['menu'].add_command(label=option_val, command=tk._setit(self.email_column_var, option_val))
+            self.email_column_var.set(default_email_option)
+            if rebuild:
+                self.email_column_menu['menu'].delete(0, 'end')
+                for option_val in options: self.email_column_menu['menu'].add_command(label=option_val, command=tk._setit(self.email_column_var, option_val))
         if hasattr(self, 'placeholder_menus'):
             for key, menu_widget in self.placeholder_menus.items():
-                current_placeholder_val = self.column_mappings[key].get(); menu_widget['menu'].delete(0, 'end')
+                current_placeholder_val = self.column_mappings[key].get()
                 default_placeholder_option = current_placeholder_val if current_placeholder_val in options else options[0]
-                self.column_mappings[key].set(default_placeholder_option) 
-                for option_val in options: menu_widget['menu'].add_command(label=option_val, command=tk._setit(self.column_mappings[key], option_val))
+                self.column_mappings[key].set(default_placeholder_option)
+                if rebuild:
+                    menu_widget['menu'].delete(0, 'end')
+                    for option_val in options: menu_widget['menu'].add_command(label=option_val, command=tk._setit(self.column_mappings[key], option_val))
+        if rebuild and hasattr(self, 'email_column_menu'): self._last_headers_sig = sig # Only once menus exist
         self.update_column_mapping_dropdowns_state()
 
     def update_column_mapping_dropdowns_state(self): # Same as before
@@ -482,9 +657,9 @@ class BulkEmailerApp:
         if hasattr(self, 'placeholder_menus'):
             for menu in self.placeholder_menus.values(): menu.config(state=state)
 
-    def _is_valid_email(self, email_string): # Same as before
+    def _is_valid_email(self, email_string):
         if not email_string or not isinstance(email_string, str): return False
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"; return re.match(pattern, email_string) is not None
+        return _EMAIL_RE.match(email_string) is not None
 
     def _validate_schedule_datetime(self, date_str, time_str):
         """Validates date and time strings and returns a datetime object or None."""
@@ -505,33 +680,32 @@ class BulkEmailerApp:
 
         if custom_email_data: # Previewing a specific custom email from the batch
             if custom_email_data["use_template"]:
-                for key, placeholder_text in DEFAULT_PLACEHOLDERS.items():
+                for key in DEFAULT_PLACEHOLDERS:
                     # Use the specific placeholder value for this custom email
-                    preview_fill_data[placeholder_text] = custom_email_data["template_placeholders"].get(key, f"[{key}_MISSING]")
+                    preview_fill_data[key] = custom_email_data["template_placeholders"].get(key, f"[{key}_MISSING]")
             else: # Fully custom, no placeholders to fill from template_placeholders
                 subject_template = custom_email_data["subject"]
                 body_template = custom_email_data["body"]
 
         elif manual_mode:
-            preview_fill_data[DEFAULT_PLACEHOLDERS["FIRST_NAME"]] = self.manual_first_name_var.get() or "[MANUAL_FIRST_NAME]"
-            preview_fill_data[DEFAULT_PLACEHOLDERS["LAST_NAME"]] = "" 
-            preview_fill_data[DEFAULT_PLACEHOLDERS["COMPANY_NAME"]] = self.manual_company_name_var.get() or "[MANUAL_COMPANY_NAME]"
-            preview_fill_data[DEFAULT_PLACEHOLDERS["ROLE"]] = self.manual_role_var.get() or "[MANUAL_ROLE]"
-        else: 
-            if not self.csv_data: messagebox.showinfo("Preview Info", "Load CSV data to preview bulk email."); return
-            first_row = self.csv_data[0]
-            for key, placeholder in DEFAULT_PLACEHOLDERS.items():
+            preview_fill_data["FIRST_NAME"] = self.manual_first_name_var.get() or "[MANUAL_FIRST_NAME]"
+            preview_fill_data["LAST_NAME"] = ""
+            preview_fill_data["COMPANY_NAME"] = self.manual_company_name_var.get() or "[MANUAL_COMPANY_NAME]"
+            preview_fill_data["ROLE"] = self.manual_role_var.get() or "[MANUAL_ROLE]"
+        else:
+            if self.csv_first_row is None: messagebox.showinfo("Preview Info", "Load CSV data to preview bulk email."); return
+            first_row = self.csv_first_row
+            for key in DEFAULT_PLACEHOLDERS:
                 csv_col_name = self.column_mappings[key].get()
                 if csv_col_name and csv_col_name != "Not Mapped" and csv_col_name in first_row:
-                    preview_fill_data[placeholder] = first_row[csv_col_name]
-                else: preview_fill_data[placeholder] = f"[{key.upper()}_DATA]"
-        
+                    preview_fill_data[key] = str(first_row[csv_col_name])
+                else: preview_fill_data[key] = f"[{key.upper()}_DATA]"
+
         final_subject = subject_template
         final_body = body_template
         if not custom_email_data or custom_email_data["use_template"]: # Only replace if using template or not custom_email_data
-            for placeholder, value in preview_fill_data.items():
-                final_subject = final_subject.replace(placeholder, str(value))
-                final_body = final_body.replace(placeholder, str(value))
+            final_subject = _render_template(subject_template, preview_fill_data)
+            final_body = _render_template(body_template, preview_fill_data)
         
         preview_window = tk.Toplevel(self.root); preview_window.title("Email Preview"); preview_window.geometry("600x450")
         preview_window.transient(self.root); preview_window.grab_set()
@@ -544,51 +718,115 @@ class BulkEmailerApp:
         body_prev_text.pack(pady=(0,10), padx=10, fill=tk.BOTH, expand=True)
         ttk.Button(preview_window, text="Close", command=preview_window.destroy).pack(pady=10)
 
+    def _get_cv_part(self, cv_path):
+        """Returns the base64-encoded CV attachment, re-reading the file only when the path changes."""
+        cached_path, cached_part = self._cv_part_cache
+        if cached_path == cv_path and cached_part is not None: return cached_part
+        with open(cv_path, "rb") as attachment_file: part = MIMEBase('application', 'octet-stream'); part.set_payload(attachment_file.read())
+        encoders.encode_base64(part); part.add_header('Content-Disposition', f"attachment; filename= {os.path.basename(cv_path)}")
+        self._cv_part_cache = (cv_path, part)
+        return part
+
+    def _smtp_connect(self, sender_email, sender_password):
+        """Opens a logged-in connection to Gmail SMTP."""
+        server = smtplib.SMTP("smtp.gmail.com", 587, timeout=30)
+        server.ehlo(); server.starttls(); server.ehlo(); server.login(sender_email, sender_password)
+        return server
+
+    def _drain_events(self):
+        """Applies log/progress events queued by the sender thread (runs on the Tk main loop)."""
+        try:
+            while True:
+                event = self._event_q.get_nowait()
+                kind = event[0]
+                if kind == 'log': self.log_message(event[1], error=event[2])
+                elif kind == 'progress': self.update_progress(event[1], is_custom_batch=event[2])
+                elif kind == 'alert': messagebox.showerror(event[1], event[2])
+                elif kind == 'done': self._finish_sending_ui(event[1], event[2], event[3])
+        except queue.Empty:
+            pass
+        self.root.after(100, self._drain_events)
+
     def _perform_email_sending(self, emails_to_send_list, is_test=False, is_custom_batch=False):
+        if self._send_thread is not None and self._send_thread.is_alive():
+            messagebox.showinfo("Sending In Progress", "A sending process is already running. Please wait for it to finish."); return
         cv_path = self.cv_file_path.get(); sender_email = self.smtp_email_var.get(); sender_password = self.smtp_password_var.get()
         if not is_test and cv_path and not os.path.exists(cv_path):
              self.log_message(f"CV path '{cv_path}' is invalid. Sending without CV.", error=True); cv_path = None
         elif not is_test and cv_path and not cv_path.lower().endswith(".pdf"):
              self.log_message(f"CV file '{cv_path}' is not a PDF. Sending without CV.", error=True); cv_path = None
-        
+
         progress_bar_to_use = self.custom_batch_progress_bar if is_custom_batch else self.progress_bar
         send_button_to_use = self.custom_batch_send_button if is_custom_batch else self.send_button
 
+        cv_part = None
+        if cv_path and os.path.exists(cv_path) and cv_path.lower().endswith(".pdf"):
+            try: cv_part = self._get_cv_part(cv_path)
+            except Exception as e: self.log_message(f"Failed to prepare CV attachment: {e}. Sending without CV.", error=True)
+
         self.log_message(f"Starting SMTP process for {len(emails_to_send_list)} email(s)...")
         if hasattr(send_button_to_use, 'config'): send_button_to_use.config(state=tk.DISABLED)
         if hasattr(progress_bar_to_use, 'config'): progress_bar_to_use['value'] = 0; progress_bar_to_use['maximum'] = len(emails_to_send_list) if emails_to_send_list else 1
-        sent_count = 0; failed_count = 0
+        self._send_thread = threading.Thread(target=self._bulk_send_worker,
+                                             args=(emails_to_send_list, is_test, is_custom_batch, cv_part, sender_email, sender_password),
+                                             daemon=True)
+        self._send_thread.start()
+
+    def _bulk_send_worker(self, emails_to_send_list, is_test, is_custom_batch, cv_part, sender_email, sender_password):
+        """SMTP loop run on a worker thread; touches the UI only via the event queue."""
+        emit = self._event_q.put
+        def log(message, error=False): emit(('log', message, error))
+        sent_count = 0; failed_count = 0; server = None
         try:
-            server = smtplib.SMTP("smtp.gmail.com", 587); server.ehlo(); server.starttls(); server.ehlo(); server.login(sender_email, sender_password)
-            self.log_message("Logged into Gmail SMTP server.")
+            server = self._smtp_connect(sender_email, sender_password)
+            log("Logged into Gmail SMTP server.")
+            # Static structure (From header, CV attachment) is built once; each
+            # recipient gets a shallow clone with fresh header/payload lists.
+            template_msg = MIMEMultipart(); template_msg['From'] = sender_email
+            if cv_part is not None: template_msg.attach(cv_part)
+            sends_on_connection = 0
             for i, email_details in enumerate(emails_to_send_list):
                 recipient_email = email_details['recipient_email']; current_subject = email_details['subject']; current_body = email_details['body']
                 row_identifier = email_details.get('row_identifier', f"item {i+1}")
-                msg = MIMEMultipart(); msg['From'] = sender_email; msg['To'] = recipient_email; msg['Subject'] = current_subject
-                msg.attach(MIMEText(current_body, 'plain', 'utf-8'))
-                if cv_path and os.path.exists(cv_path) and cv_path.lower().endswith(".pdf"): 
-                    try:
-                        with open(cv_path, "rb") as attachment_file: part = MIMEBase('application', 'octet-stream'); part.set_payload(attachment_file.read())
-                        encoders.encode_base64(part); part.add_header('Content-Disposition', f"attachment; filename= {os.path.basename(cv_path)}"); msg.attach(part)
-                    except Exception as e:
-                        self.log_message(f"Failed to attach CV for {recipient_email} ({row_identifier}): {e}", error=True)
-                        if not is_test: failed_count += 1; self.update_progress(i + 1, is_custom_batch); continue 
+                msg = copy.copy(template_msg)
+                msg._headers = list(template_msg._headers)
+                msg.set_payload([MIMEText(current_body, 'plain', 'utf-8')] + template_msg.get_payload())
+                msg['To'] = recipient_email; msg['Subject'] = current_subject
+                msg_bytes = msg.as_bytes(policy=policy.SMTP) # Serialize once; the retry below reuses it
+                if sends_on_connection >= SMTP_MAX_SENDS_PER_CONNECTION:
+                    log(f"Cycling SMTP connection after {sends_on_connection} sends.")
+                    try: server.quit()
+                    except Exception: pass
+                    server = self._smtp_connect(sender_email, sender_password); sends_on_connection = 0
                 try:
-                    server.sendmail(sender_email, recipient_email, msg.as_string())
-                    self.log_message(f"Email sent to {recipient_email} ({row_identifier})"); sent_count += 1
+                    try:
+                        server.sendmail(sender_email, recipient_email, msg_bytes)
+                    except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError):
+                        log("SMTP connection dropped. Reconnecting and retrying...", error=True)
+                        server = self._smtp_connect(sender_email, sender_password); sends_on_connection = 0
+                        server.sendmail(sender_email, recipient_email, msg_bytes)
+                    log(f"Email sent to {recipient_email} ({row_identifier})"); sent_count += 1; sends_on_connection += 1
                 except Exception as e:
-                    self.log_message(f"Failed to send email to {recipient_email} ({row_identifier}): {e}", error=True)
+                    log(f"Failed to send email to {recipient_email} ({row_identifier}): {e}", error=True)
                     if not is_test: failed_count += 1
-                if not is_test: self.update_progress(i + 1, is_custom_batch)
-                time.sleep(0.05) 
-            server.quit(); self.log_message("Disconnected from SMTP server.")
-        except smtplib.SMTPAuthenticationError: err = "SMTP Auth Error. Check Gmail & App Password."; self.log_message(err, error=True); messagebox.showerror("SMTP Auth Error", err);
-        except smtplib.SMTPConnectError: err = "SMTP Connection Error. Check internet."; self.log_message(err, error=True); messagebox.showerror("SMTP Connection Error", err);
-        except Exception as e: self.log_message(f"Unexpected error during sending: {e}", error=True); messagebox.showerror("Sending Error", f"Unexpected error: {e}")
+                if not is_test: emit(('progress', i + 1, is_custom_batch))
+                time.sleep(0.05)
+            server.quit(); server = None; log("Disconnected from SMTP server.")
+        except smtplib.SMTPAuthenticationError: err = "SMTP Auth Error. Check Gmail & App Password."; log(err, error=True); emit(('alert', "SMTP Auth Error", err))
+        except smtplib.SMTPConnectError: err = "SMTP Connection Error. Check internet."; log(err, error=True); emit(('alert', "SMTP Connection Error", err))
+        except Exception as e: log(f"Unexpected error during sending: {e}", error=True); emit(('alert', "Sending Error", f"Unexpected error: {e}"))
         finally:
-            self.log_message(f"Process finished. Sent: {sent_count}, Failed: {failed_count if not is_test else 'N/A for test'}.")
-            if hasattr(send_button_to_use, 'config'): send_button_to_use.config(state=tk.NORMAL)
-            if hasattr(progress_bar_to_use, 'config') and not is_test and emails_to_send_list : progress_bar_to_use['value'] = progress_bar_to_use['maximum'] 
+            if server is not None:
+                try: server.quit()
+                except Exception: pass
+            log(f"Process finished. Sent: {sent_count}, Failed: {failed_count if not is_test else 'N/A for test'}.")
+            emit(('done', is_test, is_custom_batch, bool(emails_to_send_list)))
+
+    def _finish_sending_ui(self, is_test, is_custom_batch, had_emails):
+        progress_bar_to_use = self.custom_batch_progress_bar if is_custom_batch else self.progress_bar
+        send_button_to_use = self.custom_batch_send_button if is_custom_batch else self.send_button
+        if hasattr(send_button_to_use, 'config'): send_button_to_use.config(state=tk.NORMAL)
+        if hasattr(progress_bar_to_use, 'config') and not is_test and had_emails: progress_bar_to_use['value'] = progress_bar_to_use['maximum']
 
     def update_progress(self, current_step, is_custom_batch=False):
         progress_bar_to_use = self.custom_batch_progress_bar if is_custom_batch else self.progress_bar
@@ -612,7 +850,7 @@ class BulkEmailerApp:
             cv_path_for_campaign = scheduled_campaign_data["cv_path"]
             # No need to re-validate CSV, mappings etc. as they were processed at scheduling time.
         else: # Prepare for immediate or newly scheduled send
-            if not self.csv_data: messagebox.showerror("Error", "No CSV data loaded."); return
+            if not self.csv_row_count: messagebox.showerror("Error", "No CSV data loaded."); return
             email_col_name = self.email_column_var.get()
             if not email_col_name or email_col_name == "Not Mapped" or email_col_name not in self.csv_headers:
                 messagebox.showerror("Error", "Email column not selected/invalid. Check 'Column Mapping' tab."); return
@@ -628,18 +866,21 @@ class BulkEmailerApp:
                 messagebox.showerror("Error", "CV file must be a PDF."); return
             elif not cv_path_for_campaign: self.log_message("No CV selected. Emails will be sent without attachments.", error=False)
 
-            for i, row_data in enumerate(self.csv_data):
-                recipient_email = row_data.get(email_col_name)
+            intern_cache = {} # Collapse repeated field values (companies, roles) to one str object
+            for row_num, row, col_index in self._iter_csv_rows():
+                recipient_email = self._row_value(row, col_index, email_col_name)
                 if not recipient_email or not self._is_valid_email(recipient_email):
-                    self.log_message(f"Skipping row {i+1}: Invalid/missing email '{recipient_email}'.", error=True); continue
-                current_subject = subject_template; current_body = body_template
-                for key, placeholder in DEFAULT_PLACEHOLDERS.items():
+                    self.log_message(f"Skipping row {row_num}: Invalid/missing email '{recipient_email}'.", error=True); continue
+                values = {}
+                for key in DEFAULT_PLACEHOLDERS:
                     csv_col_for_placeholder = self.column_mappings[key].get(); value_to_insert = ""
-                    if csv_col_for_placeholder and csv_col_for_placeholder != "Not Mapped" and csv_col_for_placeholder in row_data:
-                        value_to_insert = row_data[csv_col_for_placeholder]
-                    current_subject = current_subject.replace(placeholder, str(value_to_insert))
-                    current_body = current_body.replace(placeholder, str(value_to_insert))
-                emails_to_send_list.append({'recipient_email': recipient_email, 'subject': current_subject, 'body': current_body, 'row_identifier': f"CSV Row {i+1}"})
+                    if csv_col_for_placeholder and csv_col_for_placeholder != "Not Mapped":
+                        value_to_insert = self._row_value(row, col_index, csv_col_for_placeholder)
+                    value_to_insert = str(value_to_insert)
+                    values[key] = intern_cache.setdefault(value_to_insert, value_to_insert)
+                current_subject = _render_template(subject_template, values)
+                current_body = _render_template(body_template, values)
+                emails_to_send_list.append({'recipient_email': recipient_email, 'subject': current_subject, 'body': current_body, 'row_identifier': f"CSV Row {row_num}"})
             if not emails_to_send_list: messagebox.showinfo("Info", "No valid recipient emails found in CSV data."); return
 
         # Scheduling UI Date/Time or Profile's default
@@ -702,8 +943,9 @@ class BulkEmailerApp:
             cv_path = None 
         elif cv_path and not cv_path.lower().endswith(".pdf"): messagebox.showerror("Error", "CV file must be a PDF."); return
         elif not cv_path: self.log_message("No CV selected in active profile for manual send.", error=False)
-        current_subject = subject_template.replace(DEFAULT_PLACEHOLDERS["FIRST_NAME"], first_name or "").replace(DEFAULT_PLACEHOLDERS["COMPANY_NAME"], company_name or "").replace(DEFAULT_PLACEHOLDERS["ROLE"], role or "").replace(DEFAULT_PLACEHOLDERS["LAST_NAME"], "") 
-        current_body = body_template.replace(DEFAULT_PLACEHOLDERS["FIRST_NAME"], first_name or "").replace(DEFAULT_PLACEHOLDERS["COMPANY_NAME"], company_name or "").replace(DEFAULT_PLACEHOLDERS["ROLE"], role or "").replace(DEFAULT_PLACEHOLDERS["LAST_NAME"], "")
+        manual_values = {"FIRST_NAME": first_name or "", "LAST_NAME": "", "COMPANY_NAME": company_name or "", "ROLE": role or ""}
+        current_subject = _render_template(subject_template, manual_values)
+        current_body = _render_template(body_template, manual_values)
         email_details = [{'recipient_email': recipient_email, 'subject': current_subject, 'body': current_body, 'row_identifier': "Manual Send"}]
         if not messagebox.askyesno("Confirm Manual Send", f"Send email to {recipient_email} now?"): return
         self._perform_email_sending(email_details, is_test=True) 
@@ -718,21 +960,20 @@ class BulkEmailerApp:
         except tk.TclError: pass
         if active_tab_text == "Manual Send" and (self.manual_first_name_var.get() or self.manual_company_name_var.get()): 
             self.log_message("Preparing test email using data from 'Manual Send' tab inputs.")
-            test_fill_data[DEFAULT_PLACEHOLDERS["FIRST_NAME"]] = self.manual_first_name_var.get() or "[TEST_FIRST_NAME]"; test_fill_data[DEFAULT_PLACEHOLDERS["LAST_NAME"]] = "" 
-            test_fill_data[DEFAULT_PLACEHOLDERS["COMPANY_NAME"]] = self.manual_company_name_var.get() or "[TEST_COMPANY]"; test_fill_data[DEFAULT_PLACEHOLDERS["ROLE"]] = self.manual_role_var.get() or "[TEST_ROLE]"
-        elif self.csv_data:
+            test_fill_data["FIRST_NAME"] = self.manual_first_name_var.get() or "[TEST_FIRST_NAME]"; test_fill_data["LAST_NAME"] = ""
+            test_fill_data["COMPANY_NAME"] = self.manual_company_name_var.get() or "[TEST_COMPANY]"; test_fill_data["ROLE"] = self.manual_role_var.get() or "[TEST_ROLE]"
+        elif self.csv_first_row is not None:
             self.log_message("Preparing test email using data from the first CSV row.")
-            first_row = self.csv_data[0]
-            for key, placeholder in DEFAULT_PLACEHOLDERS.items():
+            first_row = self.csv_first_row
+            for key in DEFAULT_PLACEHOLDERS:
                 csv_col_name = self.column_mappings[key].get()
-                if csv_col_name and csv_col_name != "Not Mapped" and csv_col_name in first_row: test_fill_data[placeholder] = first_row[csv_col_name]
-                else: test_fill_data[placeholder] = f"[{key.upper()}_TEST_DATA]"
+                if csv_col_name and csv_col_name != "Not Mapped" and csv_col_name in first_row: test_fill_data[key] = str(first_row[csv_col_name])
+                else: test_fill_data[key] = f"[{key.upper()}_TEST_DATA]"
         else:
             self.log_message("Preparing test email using generic placeholder data (no CSV/Manual data).")
-            for key, placeholder in DEFAULT_PLACEHOLDERS.items(): test_fill_data[placeholder] = f"[{key.upper()}_GENERIC_TEST]"
-        current_subject = subject_template; current_body = body_template
-        for placeholder, value in test_fill_data.items():
-            current_subject = current_subject.replace(placeholder, str(value)); current_body = current_body.replace(placeholder, str(value))
+            for key in DEFAULT_PLACEHOLDERS: test_fill_data[key] = f"[{key.upper()}_GENERIC_TEST]"
+        current_subject = _render_template(subject_template, test_fill_data)
+        current_body = _render_template(body_template, test_fill_data)
         email_details = [{'recipient_email': sender_email, 'subject': f"[TEST EMAIL] {current_subject}", 'body': current_body, 'row_identifier': "Test Email"}]
         if not messagebox.askyesno("Confirm Test Send", f"Send a test email to yourself ({sender_email})?"): return
         self._perform_email_sending(email_details, is_test=True)
@@ -792,11 +1033,9 @@ class BulkEmailerApp:
         def generate_from_template():
             if not use_template_var.get(): return
             tpl_subject = self.email_subject_var.get(); tpl_body = self.email_body_text_widget.get("1.0", tk.END) if self.email_body_text_widget else ""
-            for key, ph_tk_var in ph_vars.items():
-                placeholder_text = DEFAULT_PLACEHOLDERS[key]
-                tpl_subject = tpl_subject.replace(placeholder_text, ph_tk_var.get() or "")
-                tpl_body = tpl_body.replace(placeholder_text, ph_tk_var.get() or "")
-            tpl_subject = tpl_subject.replace(DEFAULT_PLACEHOLDERS["LAST_NAME"], ""); tpl_body = tpl_body.replace(DEFAULT_PLACEHOLDERS["LAST_NAME"], "")
+            fill_values = {key: (ph_tk_var.get() or "") for key, ph_tk_var in ph_vars.items()}
+            fill_values["LAST_NAME"] = ""
+            tpl_subject = _render_template(tpl_subject, fill_values); tpl_body = _render_template(tpl_body, fill_values)
             subject_var.set(tpl_subject); body_text_widget.delete("1.0", tk.END); body_text_widget.insert("1.0", tpl_body)
 
         def toggle_template_fields():
@@ -870,16 +1109,16 @@ class BulkEmailerApp:
 
     # --- Persistent Scheduling Methods ---
     def load_scheduled_campaigns_from_file(self):
-        if os.path.exists(SCHEDULED_CAMPAIGNS_FILE):
-            try:
-                with open(SCHEDULED_CAMPAIGNS_FILE, "r") as f: return json.load(f)
-            except (IOError, json.JSONDecodeError):
-                self.log_message(f"Error loading scheduled campaigns file or file corrupted. Starting with empty schedule.", error=True); return {}
-        return {}
+        try:
+            with open(SCHEDULED_CAMPAIGNS_FILE, "rb") as f: return _json_loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (IOError, ValueError):
+            self.log_message(f"Error loading scheduled campaigns file or file corrupted. Starting with empty schedule.", error=True); return {}
 
     def save_scheduled_campaigns_to_file(self):
         try:
-            with open(SCHEDULED_CAMPAIGNS_FILE, "w") as f: json.dump(self.scheduled_campaigns, f, indent=4)
+            with open(SCHEDULED_CAMPAIGNS_FILE, "wb") as f: f.write(_json_dumps(self.scheduled_campaigns))
         except IOError as e: self.log_message(f"Error saving scheduled campaigns data: {e}", error=True)
 
     def periodic_schedule_check(self):